@@ -6,15 +6,14 @@ Creates N pickled input files and uploads them to storage (GCS or local).
 
 import os
 import sys
-
-import dill  # Use dill instead of pickle for better serialization support
+from concurrent.futures import ThreadPoolExecutor
 
 # Add scripts directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from epymodelingsuite.dispatcher import dispatch_builder
 from epymodelingsuite.telemetry import ExecutionTelemetry
-from util import storage
+from util import serialization, storage
 from util.config import load_all_configs, resolve_configs, upload_model_configs
 from util.error_handling import handle_stage_error
 from util.logger import setup_logger
@@ -22,6 +21,36 @@ from util.logger import setup_logger
 # Task index formatting (supports up to 99999 tasks)
 INDEX_WIDTH = 5
 
+# Per-task filename template, formatted with the task index
+INPUT_FILENAME = f"input_{{:0{INDEX_WIDTH}d}}.pkl.gz"
+
+# Maximum concurrent input file saves (pickle, compress and upload)
+MAX_SAVE_WORKERS = 32
+
+
+def _save_input(idx: int, output) -> tuple[str, int]:
+    """Pickle one dispatch output and save it as an input file.
+
+    Parameters
+    ----------
+    idx : int
+        Task index of the output
+    output
+        Dispatch output for the task
+
+    Returns
+    -------
+    tuple[str, int]
+        Storage path and size in bytes of the saved (compressed) file
+    """
+    # Pickle straight into gzip (stdlib pickle protocol 5, dill for objects that need it)
+    data = serialization.dumps_compressed(output)
+
+    # Upload to storage (GCS or local)
+    path = storage.get_path("builder-artifacts", INPUT_FILENAME.format(idx))
+    storage.save_bytes(path, data, compress=False)
+    return path, len(data)
+
 
 def build_and_save_dispatch_outputs(
     basemodel_config,
@@ -69,15 +98,12 @@ def build_and_save_dispatch_outputs(
         if not isinstance(outputs, list):
             outputs = [outputs]
 
-        # Save each output as a pickled input file
-        for idx, output in enumerate(outputs):
-            # Pickle the data using dill
-            data = dill.dumps(output)
-
-            # Upload to storage (GCS or local)
-            path = storage.get_path("builder-artifacts", f"input_{idx:0{INDEX_WIDTH}d}.pkl.gz")
-            storage.save_bytes(path, data)
-            logger.debug(f"Saved: {path} ({len(data):,} bytes)")
+        # Save each output as a pickled input file. Outputs are independent, and
+        # compression and uploads release the GIL, so they overlap across tasks.
+        max_workers = max(1, min(MAX_SAVE_WORKERS, len(outputs)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for path, size in executor.map(_save_input, range(len(outputs)), outputs):
+                logger.debug("Saved: %s (%d bytes)", path, size)
 
         # Save telemetry summary
         storage.save_telemetry_summary(builder_telemetry, "builder_summary")
@@ -112,7 +138,7 @@ def main() -> None:
     Outputs
     -------
     Saves to storage:
-        - builder-artifacts/input_{00000..N-1}.pkl : Pickled workload inputs
+        - builder-artifacts/input_{00000..N-1}.pkl.gz : Pickled workload inputs
         - summaries/json/builder_summary.json : Telemetry metadata
         - summaries/txt/builder_summary.txt : Human-readable telemetry
 
@@ -5,20 +5,31 @@ Loads all result pickle files from Stage B, generates formatted outputs using
 dispatch_output_generator, and saves CSV.gz files to storage.
 """
 
+import functools
+import gzip
+import io
 import logging
 import os
+import pickle
+import re
 import sys
+import zlib
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-import dill
-
 # Add scripts directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from epymodelingsuite.config_loader import load_output_config_from_file
 from epymodelingsuite.dispatcher import dispatch_output_generator
+from epymodelingsuite.schema.output import FigureOutputTypeEnum, TabularOutputTypeEnum
 from epymodelingsuite.telemetry import ExecutionTelemetry, create_workflow_telemetry
-from util import storage
+from google.api_core.exceptions import GoogleAPICallError
+from requests.exceptions import RequestException
+from util import serialization, storage
 from util.config import resolve_output_config
 from util.error_handling import handle_stage_error
 from util.logger import setup_logger
@@ -26,6 +37,67 @@ from util.logger import setup_logger
 # Task index formatting (supports up to 99999 tasks)
 INDEX_WIDTH = 5
 
+# Per-task filename templates, formatted with the task index
+RESULT_FILENAME = f"result_{{:0{INDEX_WIDTH}d}}.pkl.gz"
+RUNNER_SUMMARY_FILENAME = f"runner_{{:0{INDEX_WIDTH}d}}_summary.json"
+
+# Parses the task index back out of a result file path
+RESULT_FILENAME_PATTERN = re.compile(rf"result_(\d{{{INDEX_WIDTH}}})\.pkl\.gz$")
+
+# Read buffer for decompressed result streams; large reads keep the unpickler
+# from crossing into zlib in small increments
+READ_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# GCS and HTTP errors from cloud storage (e.g. ServiceUnavailable, TooManyRequests
+# after retries, connection resets); missing objects surface as FileNotFoundError
+_STORAGE_ERRORS = (GoogleAPICallError, RequestException)
+
+# Errors that mark a single result file as failed rather than aborting Stage C:
+# I/O and decompression errors (gzip.BadGzipFile is an OSError), storage errors,
+# truncated or corrupt pickles (the unpickler raises ValueError, TypeError,
+# KeyError or IndexError on garbage or an unsupported protocol, not only
+# UnpicklingError), and pickles referencing classes missing from this environment
+_RESULT_LOAD_ERRORS = (
+    OSError,
+    *_STORAGE_ERRORS,
+    EOFError,
+    zlib.error,
+    pickle.UnpicklingError,
+    ValueError,
+    TypeError,
+    KeyError,
+    IndexError,
+    AttributeError,
+    ImportError,
+)
+
+# Errors for a missing, unreadable or malformed telemetry summary (skipped during
+# aggregation, which stays best-effort)
+_TELEMETRY_LOAD_ERRORS = (
+    FileNotFoundError,
+    *_STORAGE_ERRORS,
+    ValueError,
+    KeyError,
+    TypeError,
+)
+
+# Output types serialized to bytes and saved to storage; other types are in-memory only
+BYTE_OUTPUT_TYPES = frozenset(
+    {
+        TabularOutputTypeEnum.CSVBytes,
+        TabularOutputTypeEnum.Parquet,
+        FigureOutputTypeEnum.PNG,
+        FigureOutputTypeEnum.PDF,
+        FigureOutputTypeEnum.SVG,
+    }
+)
+
+# Maximum number of result files fetched from storage concurrently
+MAX_LOAD_WORKERS = 32
+
+# Maximum number of output files uploaded to storage concurrently
+MAX_SAVE_WORKERS = 16
+
 
 def detect_result_type(result) -> str:
     """Detect whether a result is a simulation or calibration.
@@ -45,7 +117,29 @@ def detect_result_type(result) -> str:
     ValueError
         If result type cannot be determined
     """
-    type_name = type(result).__name__
+    return _result_type_for_class(type(result))
+
+
+@functools.cache
+def _result_type_for_class(result_class: type) -> str:
+    """Map a result class to its result type (cached per class).
+
+    Parameters
+    ----------
+    result_class : type
+        Class of a result object from Stage B
+
+    Returns
+    -------
+    str
+        "simulation" or "calibration"
+
+    Raises
+    ------
+    ValueError
+        If result type cannot be determined
+    """
+    type_name = result_class.__name__
     if "Simulation" in type_name:
         return "simulation"
     elif "Calibration" in type_name:
@@ -54,6 +148,95 @@ def detect_result_type(result) -> str:
         raise ValueError(f"Unknown result type: {type_name}")
 
 
+def _result_path(task_index: int) -> str:
+    """Build the storage path of a Stage B result file.
+
+    Parameters
+    ----------
+    task_index : int
+        Runner task index
+
+    Returns
+    -------
+    str
+        Storage path of the task's result pickle file
+    """
+    return storage.get_path("runner-artifacts", RESULT_FILENAME.format(task_index))
+
+
+def _load_result(result_path: str) -> tuple[object, int]:
+    """Load and deserialize a single result file from storage.
+
+    Runs inside a worker thread of load_all_results. The gzipped pickle is
+    streamed through decompression into the unpickler, so neither the
+    compressed nor the decompressed payload is held in memory as a whole.
+
+    Parameters
+    ----------
+    result_path : str
+        Storage path of the result pickle file
+
+    Returns
+    -------
+    tuple[object, int]
+        Tuple of (result, num_bytes) where num_bytes is the decompressed size of the data
+
+    Notes
+    -----
+    Unpickling deliberately stays in the worker thread rather than a process
+    pool: a result unpickled in a child process would have to be pickled again
+    to return it to the parent, doubling the serialization cost. zlib releases
+    the GIL while decompressing, so decompression still overlaps across threads.
+    """
+    with (
+        storage.open_stream(result_path) as stream,
+        gzip.GzipFile(fileobj=stream, mode="rb") as gz,
+        io.BufferedReader(gz, buffer_size=READ_BUFFER_SIZE) as reader,
+    ):
+        result = serialization.load(reader)
+        return result, reader.tell()
+
+
+def iter_results(result_paths: dict[int, str]) -> Iterator[tuple[int, str, Future]]:
+    """Load Stage B result files concurrently and yield them in task order.
+
+    At most 2 * MAX_LOAD_WORKERS loads are submitted ahead of the consumer,
+    which keeps fetches overlapping without queueing every task up front. If
+    the consumer stops early, loads that have not started yet are cancelled.
+    The window does not bound memory for consumers that keep every result:
+    load_all_results holds them all, since dispatch_output_generator takes
+    the results as a list.
+
+    Parameters
+    ----------
+    result_paths : dict[int, str]
+        Mapping of task index to result file path, in task order
+
+    Yields
+    ------
+    tuple[int, str, Future]
+        Tuple of (task_index, result_path, future) where the completed future
+        resolves to (result, num_bytes) or raises the load error
+    """
+    window = 2 * MAX_LOAD_WORKERS
+    executor = ThreadPoolExecutor(max_workers=max(1, min(MAX_LOAD_WORKERS, len(result_paths))))
+    try:
+        pending = deque()
+        for i, result_path in result_paths.items():
+            pending.append((i, result_path, executor.submit(_load_result, result_path)))
+            if len(pending) >= window:
+                i_done, path_done, future = pending.popleft()
+                future.exception()  # Wait for completion without raising
+                yield i_done, path_done, future
+
+        while pending:
+            i_done, path_done, future = pending.popleft()
+            future.exception()
+            yield i_done, path_done, future
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def load_all_results(
     num_tasks: int, logger: logging.Logger, allow_partial: bool = False
 ) -> tuple[list, str]:
@@ -78,7 +261,8 @@ def load_all_results(
     Raises
     ------
     ValueError
-        If any result files are missing (when allow_partial=False) or if no results could be loaded
+        If any result files are missing (when allow_partial=False), if no results could be
+        loaded, or if the first loaded result has an unknown type
     """
     results = []
     result_type = None
@@ -87,28 +271,52 @@ def load_all_results(
 
     logger.info(f"Loading {num_tasks} result files from Stage B")
 
-    # First pass: Check which files exist and load them
+    # List existing result files once instead of probing each missing task
+    present_tasks = set()
+    for path in storage.list_prefix(storage.get_path("runner-artifacts", "result_")):
+        match = RESULT_FILENAME_PATTERN.search(path)
+        if match:
+            present_tasks.add(int(match.group(1)))
+
+    result_paths = {}
     for i in range(num_tasks):
-        result_path = storage.get_path("runner-artifacts", f"result_{i:0{INDEX_WIDTH}d}.pkl.gz")
-        logger.debug(f"Checking: {result_path}")
+        if i in present_tasks:
+            result_paths[i] = _result_path(i)
+        else:
+            logger.warning(f"MISSING: File not found: {_result_path(i)}")
+            missing_tasks.append(i)
 
-        try:
-            raw_data = storage.load_bytes(result_path)
-            result = dill.loads(raw_data)
-            results.append(result)
+    # Strict mode: fail before fetching anything if results are already missing
+    if missing_tasks and not allow_partial:
+        error_msg = f"Partial results: {len(missing_tasks)} task(s) missing out of {num_tasks}\n"
+        error_msg += f"Missing result files (tasks): {missing_tasks}\n"
+        error_msg += "\nPlease investigate Stage B failures before generating outputs."
+        error_msg += "\nTo generate outputs with partial results, set ALLOW_PARTIAL_RESULTS=true"
+        raise ValueError(error_msg)
 
-            # Determine result type from first result
-            if result_type is None:
-                result_type = detect_result_type(result)
-                logger.info(f"Detected result type: {result_type}")
+    # Consume results in task order as they finish loading
+    for i, result_path, future in iter_results(result_paths):
+        logger.debug("Checking: %s", result_path)
 
-            logger.debug(f"Loaded: {len(raw_data):,} bytes")
+        try:
+            result, num_bytes = future.result()
         except FileNotFoundError:
             logger.warning(f"MISSING: File not found: {result_path}")
             missing_tasks.append(i)
-        except Exception as e:
+            continue
+        except _RESULT_LOAD_ERRORS as e:
             logger.warning(f"FAILED: {type(e).__name__}: {e}")
             failed_tasks.append(i)
+            continue
+
+        # Determine result type from first result; an unknown type aborts
+        # immediately (cancelling pending loads) since no output can be generated
+        if result_type is None:
+            result_type = detect_result_type(result)
+            logger.info(f"Detected result type: {result_type}")
+
+        results.append(result)
+        logger.debug("Loaded: %d bytes", num_bytes)
 
     # Report results
     successful = len(results)
@@ -203,8 +411,6 @@ def load_configuration(config: dict, logger: logging.Logger) -> tuple:
         sys.exit(1)
 
     logger.debug(f"Output config: {output_config_path}")
-    from epymodelingsuite.config_loader import load_output_config_from_file
-
     output_config = load_output_config_from_file(output_config_path)
     logger.info("Output config loaded successfully")
     return output_config, output_config_path
@@ -260,20 +466,45 @@ def generate_outputs(
         f"Output dictionary contains {len(output_dict)} keys with {total_outputs} OutputObject instances"
     )
     for output_key, output_objects in output_dict.items():
-        logger.debug(f"  - {output_key}: {len(output_objects)} files")
+        logger.debug("  - %s: %d files", output_key, len(output_objects))
         for obj in output_objects:
-            logger.debug(f"    - {obj.name} ({obj.output_type})")
+            logger.debug("    - %s (%s)", obj.name, obj.output_type)
 
     return output_dict
 
 
+def _drain_outputs(output_dict: dict) -> Iterator:
+    """Yield OutputObjects while removing them from output_dict.
+
+    Parameters
+    ----------
+    output_dict : dict
+        Dictionary mapping output keys to lists of OutputObject instances
+
+    Yields
+    ------
+    OutputObject
+        Each output object, in dictionary order
+    """
+    for output_key in list(output_dict):
+        output_objects = output_dict.pop(output_key)
+        output_objects.reverse()
+        while output_objects:
+            yield output_objects.pop()
+
+
 def save_output_files(output_dict: dict, logger: logging.Logger, timestamp: str) -> None:
     """Save output files to storage in a timestamped subdirectory.
 
+    Entries are removed from output_dict as their uploads are submitted, so
+    each output's data is released as soon as its upload finishes instead of
+    living until every file has been saved.
+
     Parameters
     ----------
     output_dict : dict
-        Dictionary mapping output keys to lists of OutputObject instances
+        Dictionary mapping output keys to lists of OutputObject instances.
+        Emptied by this function.
     logger : logging.Logger
         Logger instance for output
     timestamp : str
@@ -284,49 +515,39 @@ def save_output_files(output_dict: dict, logger: logging.Logger, timestamp: str)
     Exception
         If any file save operation fails
     """
-    from epymodelingsuite.schema.output import FigureOutputTypeEnum, TabularOutputTypeEnum
-
     logger.info(f"Saving output files to storage (outputs/{timestamp}/)")
 
-    # Flatten output_dict to get all OutputObjects
-    all_outputs = [obj for objects in output_dict.values() for obj in objects]
-
-    files_saved = 0
     files_skipped = 0
-    for output_obj in all_outputs:
-        # Determine if this is a serializable byte-based output
-        is_byte_output = False
-
-        # Check tabular outputs
-        if isinstance(output_obj.output_type, TabularOutputTypeEnum):
-            is_byte_output = output_obj.output_type in (
-                TabularOutputTypeEnum.CSVBytes,
-                TabularOutputTypeEnum.Parquet,
-            )
-        # Check figure outputs
-        elif isinstance(output_obj.output_type, FigureOutputTypeEnum):
-            is_byte_output = output_obj.output_type in (
-                FigureOutputTypeEnum.PNG,
-                FigureOutputTypeEnum.PDF,
-                FigureOutputTypeEnum.SVG,
-            )
+    saved_names = set()
+
+    def byte_outputs():
+        """Yield (path, data, compress) for each byte output, skipping in-memory ones."""
+        nonlocal files_skipped
+        for output_obj in _drain_outputs(output_dict):
+            # Skip in-memory formats (DataFrame, MPLFigure)
+            if output_obj.output_type not in BYTE_OUTPUT_TYPES:
+                logger.debug(
+                    "Skipping in-memory output: %s (%s)", output_obj.name, output_obj.output_type
+                )
+                files_skipped += 1
+                continue
+
+            # Outputs with the same name would overwrite each other in storage
+            if output_obj.name in saved_names:
+                logger.warning(f"Duplicate output file name, overwriting: {output_obj.name}")
+            saved_names.add(output_obj.name)
 
-        if is_byte_output:
             # Save to timestamped subdirectory: outputs/{timestamp}/{filename}
             output_path = storage.get_path("outputs", timestamp, output_obj.name)
-            logger.debug(f"Saving: {output_path}")
+            logger.debug("Saving: %s (%d bytes)", output_path, len(output_obj.data))
 
             # CSVBytes are already gzipped by pandas to_csv(compression="gzip")
             # Disable auto-compression to avoid double-gzipping
             compress = False if output_obj.output_type == TabularOutputTypeEnum.CSVBytes else None
-            storage.save_bytes(output_path, output_obj.data, compress=compress)
+            yield output_path, output_obj.data, compress
 
-            logger.debug(f"Saved: {len(output_obj.data):,} bytes")
-            files_saved += 1
-        # Skip in-memory formats (DataFrame, MPLFigure)
-        else:
-            logger.debug(f"Skipping in-memory output: {output_obj.name} ({output_obj.output_type})")
-            files_skipped += 1
+    # Upload all byte outputs concurrently; the first failure propagates to the caller
+    files_saved = storage.save_bytes_many(byte_outputs(), max_workers=MAX_SAVE_WORKERS)
 
     logger.info(
         f"Successfully saved {files_saved} output files to outputs/{timestamp}/ (skipped {files_skipped} in-memory objects)"
@@ -350,39 +571,44 @@ def aggregate_telemetry(num_tasks: int, logger: logging.Logger) -> None:
     """
     logger.info("Aggregating telemetry summaries")
 
-    # Load builder telemetry
-    try:
-        builder_telemetry_data = storage.load_json(
-            storage.get_path("summaries", "json", "builder_summary.json")
-        )
-        builder_telemetry = ExecutionTelemetry.from_dict(builder_telemetry_data)
-        logger.debug("Loaded builder telemetry")
-    except (FileNotFoundError, Exception) as e:
-        logger.warning(f"Could not load builder telemetry: {e}")
-        builder_telemetry = None
-
-    # Load runner telemetries
-    runner_telemetries = []
-    for i in range(num_tasks):
+    builder_path = storage.get_path("summaries", "json", "builder_summary.json")
+    output_path = storage.get_path("summaries", "json", "output_summary.json")
+    runner_paths = [
+        storage.get_path("summaries", "json", RUNNER_SUMMARY_FILENAME.format(i))
+        for i in range(num_tasks)
+    ]
+
+    # Fetch all stage telemetries concurrently, then consume them in order
+    max_workers = min(MAX_LOAD_WORKERS, num_tasks + 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        builder_future = executor.submit(storage.load_json, builder_path)
+        output_future = executor.submit(storage.load_json, output_path)
+        runner_futures = [executor.submit(storage.load_json, path) for path in runner_paths]
+
+        # Load builder telemetry
         try:
-            runner_telemetry_data = storage.load_json(
-                storage.get_path("summaries", "json", f"runner_{i:0{INDEX_WIDTH}d}_summary.json")
-            )
-            runner_telemetries.append(ExecutionTelemetry.from_dict(runner_telemetry_data))
-        except (FileNotFoundError, Exception):
-            pass
-    logger.info(f"Loaded {len(runner_telemetries)} runner telemetries")
-
-    # Load output telemetry
-    try:
-        output_telemetry_data = storage.load_json(
-            storage.get_path("summaries", "json", "output_summary.json")
-        )
-        output_telemetry = ExecutionTelemetry.from_dict(output_telemetry_data)
-        logger.debug("Loaded output telemetry")
-    except (FileNotFoundError, Exception) as e:
-        logger.warning(f"Could not load output telemetry: {e}")
-        output_telemetry = None
+            builder_telemetry = ExecutionTelemetry.from_dict(builder_future.result())
+            logger.debug("Loaded builder telemetry")
+        except _TELEMETRY_LOAD_ERRORS as e:
+            logger.warning(f"Could not load builder telemetry: {e}")
+            builder_telemetry = None
+
+        # Load runner telemetries
+        runner_telemetries = []
+        for future in runner_futures:
+            try:
+                runner_telemetries.append(ExecutionTelemetry.from_dict(future.result()))
+            except _TELEMETRY_LOAD_ERRORS:
+                pass
+        logger.info(f"Loaded {len(runner_telemetries)} runner telemetries")
+
+        # Load output telemetry
+        try:
+            output_telemetry = ExecutionTelemetry.from_dict(output_future.result())
+            logger.debug("Loaded output telemetry")
+        except _TELEMETRY_LOAD_ERRORS as e:
+            logger.warning(f"Could not load output telemetry: {e}")
+            output_telemetry = None
 
     # Create and save workflow telemetry
     try:
@@ -426,6 +652,9 @@ def main() -> None:
     OUTPUT_CONFIG_FILE : str (optional)
         Specific output config filename (e.g., "output_projection.yaml")
         If not set, uses auto-detection (output.yaml/output.yml first, then scan)
+    TRUST_FILENAME_CONVENTION : str (optional)
+        If "true", use output.yaml/output.yml without first checking its structure
+        (default: "false")
 
     Outputs
     -------
@@ -494,6 +723,7 @@ def main() -> None:
         with ExecutionTelemetry() as output_telemetry:
             # Generate output files using dispatcher
             output_dict = generate_outputs(results, result_type, output_config, logger)
+            del results  # Free Stage B results before uploading outputs
 
             # Save output files to storage in subdirectory
             save_output_files(output_dict, logger, output_subdir)
@@ -7,14 +7,12 @@ Loads pickled input from storage (GCS or local), runs simulation, saves results.
 import os
 import sys
 
-import dill  # Use dill instead of pickle for better serialization support
-
 # Add scripts directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from epymodelingsuite.dispatcher import dispatch_runner
 from epymodelingsuite.telemetry import ExecutionTelemetry
-from util import storage
+from util import serialization, storage
 from util.error_handling import handle_stage_error
 from util.logger import setup_logger
 
@@ -102,7 +100,7 @@ def main() -> None:
 
         try:
             raw_data = storage.load_bytes(input_path)
-            workload = dill.loads(raw_data)
+            workload = serialization.loads(raw_data)
             logger.debug(f"Input loaded: {len(raw_data):,} bytes")
         except Exception as e:
             logger.error(f"Failed to load input: {e}")
@@ -122,8 +120,8 @@ def main() -> None:
             logger.debug(f"Saving results: {output_path}")
 
             try:
-                output_data = dill.dumps(result)
-                storage.save_bytes(output_path, output_data)
+                output_data = serialization.dumps_compressed(result)
+                storage.save_bytes(output_path, output_data, compress=False)
                 logger.debug(f"Results saved: {len(output_data):,} bytes")
             except Exception as e:
                 logger.error(f"Failed to save results: {e}")
@@ -1,21 +1,376 @@
 """Configuration file resolution and loading utilities."""
 
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from epymodelingsuite.config_loader import (
-    load_basemodel_config_from_file,
-    load_calibration_config_from_file,
-    load_output_config_from_file,
-    load_sampling_config_from_file,
-)
-from epymodelingsuite.schema.general import validate_cross_config_consistency
-from epymodelingsuite.utils import identify_config_type
+import yaml
 
 # Module-level logger for utility logging
 _logger = logging.getLogger(__name__)
 
 
+# epymodelingsuite is imported on first use: resolving config paths only needs
+# identify_config_type, and importing the config loaders pulls in every schema.
+
+
+def identify_config_type(path: str) -> str | None:
+    """Identify a config file type (see epymodelingsuite.utils.identify_config_type)."""
+    from epymodelingsuite.utils import identify_config_type as _identify_config_type
+
+    return _identify_config_type(path)
+
+
+def load_basemodel_config_from_file(path: str):
+    """Load a basemodel config (see epymodelingsuite.config_loader)."""
+    from epymodelingsuite.config_loader import load_basemodel_config_from_file as _load
+
+    return _load(path)
+
+
+def load_sampling_config_from_file(path: str):
+    """Load a sampling config (see epymodelingsuite.config_loader)."""
+    from epymodelingsuite.config_loader import load_sampling_config_from_file as _load
+
+    return _load(path)
+
+
+def load_calibration_config_from_file(path: str):
+    """Load a calibration config (see epymodelingsuite.config_loader)."""
+    from epymodelingsuite.config_loader import load_calibration_config_from_file as _load
+
+    return _load(path)
+
+
+def load_output_config_from_file(path: str):
+    """Load an output config (see epymodelingsuite.config_loader)."""
+    from epymodelingsuite.config_loader import load_output_config_from_file as _load
+
+    return _load(path)
+
+
+def validate_cross_config_consistency(basemodel_config, modelset_config, output_config):
+    """Validate configs against each other (see epymodelingsuite.schema.general)."""
+    from epymodelingsuite.schema.general import (
+        validate_cross_config_consistency as _validate_cross_config_consistency,
+    )
+
+    return _validate_cross_config_consistency(basemodel_config, modelset_config, output_config)
+
+
+# Use the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Subdirectory listings used when searching for experiment config directories,
+# keyed by directory and validated against its mtime (see clear_caches())
+_subdir_cache: dict[str, tuple[int, list[str]]] = {}
+
+# Maximum number of files whose identified config type is memoized
+_IDENTIFY_CACHE_SIZE = 100
+
+# LRU cache of path -> (mtime_ns, size, config_type)
+_identify_cache: OrderedDict[str, tuple[int, int, str | None]] = OrderedDict()
+_identify_cache_lock = threading.Lock()
+
+
+# Root keys that mark a config's type, and the modelset keys that pick its workflow
+_CONFIG_MARKERS = frozenset({"model", "modelset", "output"})
+_MODELSET_TYPES = frozenset({"sampling", "calibration"})
+
+
+def _peek_config_type(path: str) -> str | None:
+    """Identify a basemodel or modelset config from its YAML event stream.
+
+    Walks the parser events of the first document and records only the
+    marker keys at the root and directly under ``modelset``, without
+    constructing Python objects for the document. Parsing stops at the end
+    of the first document, or as soon as a second marker makes the type
+    ambiguous. Returns None whenever the file is not an unambiguous,
+    single-document basemodel or modelset config, so the caller can fall
+    back to identify_config_type().
+
+    Parameters
+    ----------
+    path : str
+        Path to the YAML config file
+
+    Returns
+    -------
+    str | None
+        "basemodel", "sampling" or "calibration", or None if undetermined
+    """
+    root_markers = set()
+    modelset_types = set()
+
+    # One entry per open collection: [is_mapping, expecting_key, current_key]
+    stack = []
+    try:
+        with open(path, "rb") as f:
+            events = yaml.parse(f, Loader=_YAML_LOADER)
+            for event in events:
+                if isinstance(event, yaml.DocumentEndEvent):
+                    # A further document makes the file ambiguous (and not a
+                    # single config for identify_config_type() either)
+                    if isinstance(next(events, None), yaml.DocumentStartEvent):
+                        return None
+                    break
+
+                if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                    is_mapping = isinstance(event, yaml.MappingStartEvent)
+                    if not stack and not is_mapping:
+                        return None
+                    stack.append([is_mapping, True, None])
+                    continue
+
+                if isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                    stack.pop()
+                    if stack and stack[-1][0]:
+                        stack[-1][1] = True
+                    continue
+
+                if not isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)) or not stack:
+                    continue
+
+                top = stack[-1]
+                if not top[0]:
+                    continue
+                if not top[1]:
+                    # Scalar value of the current key
+                    top[1] = True
+                    continue
+
+                # Mapping key; stop as soon as a second marker makes it ambiguous
+                key = getattr(event, "value", None)
+                top[1] = False
+                top[2] = key
+                if len(stack) == 1 and key in _CONFIG_MARKERS:
+                    root_markers.add(key)
+                    if len(root_markers) > 1:
+                        return None
+                elif len(stack) == 2 and stack[0][2] == "modelset" and key in _MODELSET_TYPES:
+                    modelset_types.add(key)
+                    if len(modelset_types) > 1:
+                        return None
+    except (OSError, yaml.YAMLError):
+        return None
+
+    if root_markers == {"model"}:
+        return "basemodel"
+    if root_markers == {"modelset"} and len(modelset_types) == 1:
+        return modelset_types.pop()
+    return None
+
+
+def _cached_identify(path: str) -> str | None:
+    """Identify a config file type, memoized by path, modification time and size.
+
+    A file whose mtime or size changed since it was last identified is parsed
+    again, so edits are always picked up.
+
+    Parameters
+    ----------
+    path : str
+        Path to the YAML config file
+
+    Returns
+    -------
+    str | None
+        Config type as returned by identify_config_type()
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+
+    with _identify_cache_lock:
+        cached = _identify_cache.get(path)
+        if cached is not None and cached[:2] == key:
+            _identify_cache.move_to_end(path)
+            return cached[2]
+
+    # Cheap structural peek first; full identification only when it is undetermined
+    config_type = _peek_config_type(path) or identify_config_type(path)
+
+    with _identify_cache_lock:
+        _identify_cache[path] = (*key, config_type)
+        _identify_cache.move_to_end(path)
+        if len(_identify_cache) > _IDENTIFY_CACHE_SIZE:
+            _identify_cache.popitem(last=False)
+
+    return config_type
+
+
+def _identify_safe(path: Path) -> tuple[str | None, Exception | None]:
+    """Identify a config file, returning (config_type, None) or (None, error)."""
+    try:
+        return _cached_identify(str(path)), None
+    except Exception as e:
+        return None, e
+
+
+def _identify_all(paths: list[Path]) -> list[tuple[str | None, Exception | None]]:
+    """Identify config files concurrently, in the order given.
+
+    Parameters
+    ----------
+    paths : list[Path]
+        Config file paths
+
+    Returns
+    -------
+    list[tuple[str | None, Exception | None]]
+        (config_type, error) per path; error is set if the file could not be identified
+    """
+    if len(paths) <= 1:
+        return [_identify_safe(path) for path in paths]
+    # Files are independent; overlap their reads and parses
+    with ThreadPoolExecutor(max_workers=min(len(paths), 8)) as executor:
+        return list(executor.map(_identify_safe, paths))
+
+
+def _list_yaml_files(directory: Path) -> list[Path]:
+    """List YAML files (*.yml, *.yaml) in a directory with a single directory scan.
+
+    Parameters
+    ----------
+    directory : Path
+        Directory to scan (non-recursive)
+
+    Returns
+    -------
+    list[Path]
+        YAML file paths sorted by name
+    """
+    # DirEntry.is_file() uses the file type from the directory listing, so
+    # regular files need no extra stat call
+    with os.scandir(directory) as entries:
+        names = sorted(
+            entry.name
+            for entry in entries
+            if entry.name.endswith((".yml", ".yaml")) and entry.is_file()
+        )
+    return [directory / name for name in names]
+
+
+def _list_subdirs_cached(directory: str) -> list[str]:
+    """List subdirectory names of a directory, cached until the directory changes.
+
+    The cached listing is validated against the directory's mtime, so adding
+    or removing a subdirectory costs one rescan while unchanged directories
+    only cost a stat.
+
+    Parameters
+    ----------
+    directory : str
+        Directory to scan (non-recursive)
+
+    Returns
+    -------
+    list[str]
+        Subdirectory names sorted by name (empty if the directory doesn't exist)
+    """
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+    cached = _subdir_cache.get(directory)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    with os.scandir(directory) as entries:
+        subdirs = sorted(entry.name for entry in entries if entry.is_dir())
+    _subdir_cache[directory] = (mtime_ns, subdirs)
+    return subdirs
+
+
+def clear_caches() -> None:
+    """Clear the cached directory listings and config types.
+
+    Cached entries are validated against file and directory mtimes, so this is
+    only needed when changes could go unnoticed, e.g. a file rewritten in place
+    within the filesystem's mtime resolution.
+    """
+    _subdir_cache.clear()
+    with _identify_cache_lock:
+        _identify_cache.clear()
+
+
+def _find_nested_config_dirs(base_dir: str, exp_name: str) -> list[Path]:
+    """Find {base_dir}/*/{exp_name}/config by walking one directory level explicitly.
+
+    Equivalent to base_dir.glob(f"*/{exp_name}/config") without pattern matching
+    over every entry below base_dir. The base directory listing is cached and
+    validated against its mtime, so repeated searches (e.g.
+    resolve_output_config falling back to resolve_configs) only rescan it
+    when it changes.
+
+    Parameters
+    ----------
+    base_dir : str
+        Base experiments directory
+    exp_name : str
+        Experiment directory name to look for inside each subdirectory
+
+    Returns
+    -------
+    list[Path]
+        Matching config directory paths sorted by name
+    """
+    candidates = (
+        os.path.join(base_dir, child, exp_name, "config")
+        for child in _list_subdirs_cached(base_dir)
+    )
+    return [Path(candidate) for candidate in candidates if os.path.isdir(candidate)]
+
+
+def _find_exp_config_dirs(exp_id: str, config_dir: str) -> tuple[Path, ...]:
+    """Find the config directory candidates for an experiment.
+
+    Uses {config_dir}/{exp_id}/config if it exists. Otherwise searches for the
+    experiment name (last component of exp_id) at the top level and one
+    directory level below config_dir. Results are not cached, so a directory
+    created after a failed lookup is found by the next one.
+
+    Parameters
+    ----------
+    exp_id : str
+        Experiment ID (e.g., 'test-sim', 'flu_round05', 'test/my-exp')
+    config_dir : str
+        Base directory for experiments
+
+    Returns
+    -------
+    tuple[Path, ...]
+        Matching config directories (empty if none found; more than one if ambiguous)
+    """
+    # Paths are joined as strings and only wrapped in Path for the results
+    exp_config_dir = os.path.join(config_dir, exp_id, "config")
+    if os.path.isdir(exp_config_dir):
+        return (Path(exp_config_dir),)
+
+    _logger.debug("Direct path not found: %s, searching in subdirectories...", exp_config_dir)
+
+    # Extract the actual experiment name (last component if path contains /)
+    # e.g., "test/test-flu-projection-2025-01" -> "test-flu-projection-2025-01"
+    exp_name = exp_id.split("/")[-1]
+
+    # Search for exp_name in the directory tree
+    # Try both top-level and subdirectory patterns
+    found_paths = []
+
+    # Check if it exists directly at top level
+    top_level_path = os.path.join(config_dir, exp_name, "config")
+    if os.path.isdir(top_level_path):
+        found_paths.append(Path(top_level_path))
+
+    # Also search in subdirectories
+    found_paths.extend(_find_nested_config_dirs(config_dir, exp_name))
+
+    return tuple(found_paths)
+
+
 def resolve_configs(
     exp_id: str, config_dir: str = "/data/forecast/experiments"
 ) -> dict[str, str | None]:
@@ -51,49 +406,26 @@ def resolve_configs(
     ValueError
         If multiple files of the same type are found
     """
-    exp_config_dir = Path(config_dir) / exp_id / "config"
+    found_paths = _find_exp_config_dirs(exp_id, config_dir)
 
-    # If direct path doesn't exist, search for the experiment in the directory tree
-    if not exp_config_dir.exists():
-        _logger.debug(f"Direct path not found: {exp_config_dir}, searching in subdirectories...")
-        base_dir = Path(config_dir)
-
-        # Extract the actual experiment name (last component if path contains /)
-        # e.g., "test/test-flu-projection-2025-01" -> "test-flu-projection-2025-01"
-        exp_name = exp_id.split("/")[-1] if "/" in exp_id else exp_id
-
-        # Search for exp_name in the directory tree
-        # Try both top-level and subdirectory patterns
-        found_paths = []
-
-        # Check if it exists directly at top level
-        top_level_path = base_dir / exp_name / "config"
-        if top_level_path.exists():
-            found_paths.append(top_level_path)
-
-        # Also search in subdirectories
-        found_paths.extend(base_dir.glob(f"*/{exp_name}/config"))
-
-        if not found_paths:
-            raise FileNotFoundError(
-                f"Config directory not found for exp_id '{exp_id}' (searched for '{exp_name}'): {exp_config_dir}"
-            )
-
-        if len(found_paths) > 1:
-            raise ValueError(
-                f"Multiple config directories found for exp_id '{exp_id}': {found_paths}"
-            )
-
-        exp_config_dir = found_paths[0]
-        _logger.info(f"Found config directory: {exp_config_dir}")
-
-    if not exp_config_dir.exists():
+    if not found_paths:
+        exp_name = exp_id.split("/")[-1]
+        exp_config_dir = os.path.join(config_dir, exp_id, "config")
         raise FileNotFoundError(
-            f"Config directory not found for exp_id '{exp_id}': {exp_config_dir}"
+            f"Config directory not found for exp_id '{exp_id}' (searched for '{exp_name}'): {exp_config_dir}"
         )
 
+    if len(found_paths) > 1:
+        raise ValueError(
+            f"Multiple config directories found for exp_id '{exp_id}': {list(found_paths)}"
+        )
+
+    exp_config_dir = found_paths[0]
+    if str(exp_config_dir) != os.path.join(config_dir, exp_id, "config"):
+        _logger.info("Found config directory: %s", exp_config_dir)
+
     # Find all YAML files in the directory
-    yaml_files = list(exp_config_dir.glob("*.yml")) + list(exp_config_dir.glob("*.yaml"))
+    yaml_files = _list_yaml_files(exp_config_dir)
 
     if not yaml_files:
         raise FileNotFoundError(f"No YAML files found in config directory: {exp_config_dir}")
@@ -117,12 +449,10 @@ def resolve_configs(
         "output": [],
     }
 
-    for yaml_file in yaml_files:
-        try:
-            config_type = identify_config_type(str(yaml_file))
-        except Exception as e:
+    for yaml_file, (config_type, error) in zip(yaml_files, _identify_all(yaml_files)):
+        if error is not None:
             # Log parsing errors but continue
-            unidentified_files.append((yaml_file.name, str(e)))
+            unidentified_files.append((yaml_file.name, str(error)))
             continue
 
         # Skip files that don't match any known type
@@ -152,7 +482,7 @@ def resolve_configs(
                 if prioritized:
                     configs[config_type] = str(prioritized)
                     _logger.info(
-                        f"Multiple output configs found, using prioritized: {prioritized.name}"
+                        "Multiple output configs found, using prioritized: %s", prioritized.name
                     )
                 else:
                     # No prioritized name found, raise error
@@ -169,9 +499,9 @@ def resolve_configs(
 
     # Log unidentified files as warnings (not errors)
     if unidentified_files:
-        _logger.warning(f"Could not identify {len(unidentified_files)} file(s)")
+        _logger.warning("Could not identify %d file(s)", len(unidentified_files))
         for filename, reason in unidentified_files:
-            _logger.warning(f"  - {filename}: {reason}")
+            _logger.warning("  - %s: %s", filename, reason)
 
     return configs
 
@@ -185,7 +515,8 @@ def resolve_output_config(
 
     If a specific filename is provided, validates the file exists and is a valid
     output config. Otherwise, tries common names (output.yaml/output.yml) first,
-    then falls back to auto-detection via resolve_configs().
+    then other files named output*.yaml/yml, and finally falls back to
+    auto-detection of every file via resolve_configs().
 
     Parameters
     ----------
@@ -210,28 +541,17 @@ def resolve_output_config(
         If file doesn't contain valid output config structure
     """
     # Find the experiment config directory (handles nested paths)
-    exp_config_dir = Path(config_dir) / exp_id / "config"
-
-    # If direct path doesn't exist, search for the experiment
-    if not exp_config_dir.exists():
-        base_dir = Path(config_dir)
-        exp_name = exp_id.split("/")[-1] if "/" in exp_id else exp_id
-
-        found_paths = []
-        top_level_path = base_dir / exp_name / "config"
-        if top_level_path.exists():
-            found_paths.append(top_level_path)
-        found_paths.extend(base_dir.glob(f"*/{exp_name}/config"))
-
-        if not found_paths:
-            raise FileNotFoundError(
-                f"Config directory not found for exp_id '{exp_id}': {exp_config_dir}"
-            )
-        if len(found_paths) > 1:
-            raise ValueError(
-                f"Multiple config directories found for exp_id '{exp_id}': {found_paths}"
-            )
-        exp_config_dir = found_paths[0]
+    found_paths = _find_exp_config_dirs(exp_id, config_dir)
+    if not found_paths:
+        exp_config_dir = os.path.join(config_dir, exp_id, "config")
+        raise FileNotFoundError(
+            f"Config directory not found for exp_id '{exp_id}': {exp_config_dir}"
+        )
+    if len(found_paths) > 1:
+        raise ValueError(
+            f"Multiple config directories found for exp_id '{exp_id}': {list(found_paths)}"
+        )
+    exp_config_dir = found_paths[0]
 
     # If specific filename provided, validate and return
     if output_config_filename:
@@ -240,29 +560,46 @@ def resolve_output_config(
             raise FileNotFoundError(f"Output config file not found: {output_config_path}")
 
         # Validate it's a valid output config
-        config_type = identify_config_type(str(output_config_path))
+        config_type = _cached_identify(str(output_config_path))
         if config_type != "output":
             raise ValueError(
                 f"File '{output_config_filename}' is not a valid output config "
                 f"(detected type: {config_type})"
             )
 
-        _logger.info(f"Using specified output config: {output_config_path}")
+        _logger.info("Using specified output config: %s", output_config_path)
         return str(output_config_path)
 
     # Try common names first: output.yaml, output.yml
+    # With TRUST_FILENAME_CONVENTION=true the name alone is trusted and the file is
+    # not parsed here; load_output_config_from_file still validates its content
+    trust_filename = os.getenv("TRUST_FILENAME_CONVENTION", "false").lower() == "true"
     for common_name in ["output.yaml", "output.yml"]:
         candidate = exp_config_dir / common_name
-        if candidate.exists():
-            config_type = identify_config_type(str(candidate))
-            if config_type == "output":
-                _logger.info(f"Found output config: {candidate}")
+        if candidate.is_file():
+            if trust_filename or _cached_identify(str(candidate)) == "output":
+                _logger.info("Found output config: %s", candidate)
                 return str(candidate)
 
-    # Fall back to auto-detection
+    # Then only files named output*.yaml/yml, before identifying every file
+    output_candidates = [
+        candidate
+        for candidate in _list_yaml_files(exp_config_dir)
+        if candidate.name.startswith("output") and _cached_identify(str(candidate)) == "output"
+    ]
+    if len(output_candidates) == 1:
+        _logger.info("Auto-detected output config: %s", output_candidates[0])
+        return str(output_candidates[0])
+    if len(output_candidates) > 1:
+        raise ValueError(
+            f"Multiple output config files found with no output.yaml/output.yml: "
+            f"{[c.name for c in output_candidates]}"
+        )
+
+    # Fall back to auto-detection over all files
     config_paths = resolve_configs(exp_id, config_dir)
     if config_paths["output"]:
-        _logger.info(f"Auto-detected output config: {config_paths['output']}")
+        _logger.info("Auto-detected output config: %s", config_paths["output"])
         return config_paths["output"]
 
     raise FileNotFoundError(
@@ -298,30 +635,42 @@ def load_all_configs(
     ValueError
         If basemodel config is not found (required)
     """
+    basemodel_path, sampling_path, calibration_path, output_path = (
+        config_paths[key] for key in ("basemodel", "sampling", "calibration", "output")
+    )
+
     # Load basemodel config (required)
-    if config_paths["basemodel"] is None:
+    if basemodel_path is None:
         raise ValueError("Basemodel config is required but was not found")
 
-    _logger.debug(f"Loading basemodel config: {config_paths['basemodel']}")
-    basemodel_config = load_basemodel_config_from_file(config_paths["basemodel"])
-
-    # Load sampling config (optional)
-    sampling_config = None
-    if config_paths["sampling"] is not None:
-        _logger.debug(f"Loading sampling config: {config_paths['sampling']}")
-        sampling_config = load_sampling_config_from_file(config_paths["sampling"])
-
-    # Load calibration config (optional)
-    calibration_config = None
-    if config_paths["calibration"] is not None:
-        _logger.debug(f"Loading calibration config: {config_paths['calibration']}")
-        calibration_config = load_calibration_config_from_file(config_paths["calibration"])
-
-    # Load output config (optional)
-    output_config = None
-    if config_paths["output"] is not None:
-        _logger.debug(f"Loading output config: {config_paths['output']}")
-        output_config = load_output_config_from_file(config_paths["output"])
+    # Optional configs are only loaded when found
+    jobs = [
+        ("basemodel", load_basemodel_config_from_file, basemodel_path),
+        ("sampling", load_sampling_config_from_file, sampling_path),
+        ("calibration", load_calibration_config_from_file, calibration_path),
+        ("output", load_output_config_from_file, output_path),
+    ]
+    jobs = [job for job in jobs if job[2] is not None]
+
+    if _logger.isEnabledFor(logging.DEBUG):
+        for config_type, _, path in jobs:
+            _logger.debug("Loading %s config: %s", config_type, path)
+
+    # Load all present configs concurrently; each is independent YAML parsing + validation
+    if len(jobs) == 1:
+        # Basemodel only: no pool needed
+        loaded = {"basemodel": load_basemodel_config_from_file(basemodel_path)}
+    else:
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {
+                config_type: executor.submit(loader, path) for config_type, loader, path in jobs
+            }
+            loaded = {config_type: future.result() for config_type, future in futures.items()}
+
+    basemodel_config = loaded["basemodel"]
+    sampling_config = loaded.get("sampling")
+    calibration_config = loaded.get("calibration")
+    output_config = loaded.get("output")
 
     # Validate consistency across all configs if any modelset/output config is provided
     if validate_consistency and (sampling_config is not None or calibration_config is not None):
@@ -352,35 +701,25 @@ def upload_model_configs(exp_id: str, config_dir: str = "/data/forecast/experime
     """
     from util.storage import save_bytes
 
-    # Find config directory
-    exp_config_dir = Path(config_dir) / exp_id / "config"
-
-    # If direct path doesn't exist, search for it (same logic as resolve_configs)
-    if not exp_config_dir.exists():
-        base_dir = Path(config_dir)
-        exp_name = exp_id.split("/")[-1] if "/" in exp_id else exp_id
-
-        found_paths = []
-        top_level_path = base_dir / exp_name / "config"
-        if top_level_path.exists():
-            found_paths.append(top_level_path)
-        found_paths.extend(base_dir.glob(f"*/{exp_name}/config"))
-
-        if not found_paths:
-            _logger.warning(f"Config directory not found: {exp_config_dir}")
-            return []
-
-        exp_config_dir = found_paths[0]
+    # Find config directory, searching for it if the direct path doesn't exist
+    # (same logic as resolve_configs)
+    found_paths = _find_exp_config_dirs(exp_id, config_dir)
+    if not found_paths:
+        _logger.warning(
+            "Config directory not found: %s", os.path.join(config_dir, exp_id, "config")
+        )
+        return []
+    exp_config_dir = found_paths[0]
 
     # Find all YAML files
-    yaml_files = list(exp_config_dir.glob("*.yaml")) + list(exp_config_dir.glob("*.yml"))
+    yaml_files = _list_yaml_files(exp_config_dir)
 
     uploaded = []
     for yaml_file in yaml_files:
         try:
-            config_type = identify_config_type(str(yaml_file))
+            config_type = _cached_identify(str(yaml_file))
         except Exception as e:
-            _logger.warning(f"Could not identify config type for {yaml_file.name}: {e}")
+            _logger.warning("Could not identify config type for %s: %s", yaml_file.name, e)
             continue
 
         # Skip output configs (handled by Stage C) and unknown types
@@ -396,9 +735,9 @@ def upload_model_configs(exp_id: str, config_dir: str = "/data/forecast/experime
         config_path = get_path("config", yaml_file.name)
         save_bytes(config_path, content, compress=False)
         uploaded.append(yaml_file.name)
-        _logger.debug(f"Uploaded config: {yaml_file.name}")
+        _logger.debug("Uploaded config: %s", yaml_file.name)
 
     if uploaded:
-        _logger.info(f"Model configs uploaded: {', '.join(uploaded)}")
+        _logger.info("Model configs uploaded: %s", ", ".join(uploaded))
 
     return uploaded
@@ -38,12 +38,18 @@ def handle_stage_error(
     ... except Exception as e:
     ...     handle_stage_error("Stage A (Builder)", e, logger)
     """
+    # Stringify once; str() of chained validation errors can be large
+    error_type = type(error).__name__
+    error_message = str(error)
     logger.error(
-        f"{stage_name} failed: {type(error).__name__}: {error}",
+        "%s failed: %s: %s",
+        stage_name,
+        error_type,
+        error_message,
         exc_info=True,  # Includes full traceback
         extra={
-            "error_type": type(error).__name__,
-            "error_message": str(error),
+            "error_type": error_type,
+            "error_message": error_message,
             "failed_stage": stage_name,
         },
     )
@@ -9,6 +9,10 @@ import logging
 import os
 import sys
 
+# LOG_LEVEL values accepted by setup_logger (every name the logging module knows,
+# including WARN, FATAL and NOTSET); anything else falls back to INFO
+_LEVELS = logging.getLevelNamesMapping()
+
 
 def setup_logger(
     name: str,
@@ -60,7 +64,7 @@ def setup_logger(
 
     # Set log level from environment (default: INFO)
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-    logger.setLevel(getattr(logging, log_level, logging.INFO))
+    logger.setLevel(_LEVELS.get(log_level, logging.INFO))
 
     # Remove existing handlers to avoid duplicates if called multiple times
     logger.handlers.clear()
@@ -108,26 +112,28 @@ def _create_cloud_formatter(
             "Add 'python-json-logger>=2.0.0' to docker/requirements.txt"
         )
 
+    # Context fields are fixed for the logger's lifetime, so build them once
+    # Stage context is always present; the rest only when provided
+    static_context = {"stage": stage}
+    if exp_id:
+        static_context["exp_id"] = exp_id
+    if run_id:
+        static_context["run_id"] = run_id
+    if task_index is not None:
+        static_context["task_index"] = task_index
+
     # Custom formatter that adds context fields to every log entry
     class CloudFormatter(jsonlogger.JsonFormatter):
         def add_fields(self, log_record, record, message_dict):
             """Add custom fields to every log entry."""
             super().add_fields(log_record, record, message_dict)
 
-            # Add stage context (always present)
-            log_record["stage"] = stage
-
-            # Add optional context
-            if exp_id:
-                log_record["exp_id"] = exp_id
-            if run_id:
-                log_record["run_id"] = run_id
-            if task_index is not None:
-                log_record["task_index"] = task_index
+            log_record.update(static_context)
 
             # Rename 'levelname' to 'severity' for Cloud Logging compatibility
-            if "levelname" in log_record:
-                log_record["severity"] = log_record.pop("levelname")
+            severity = log_record.pop("levelname", None)
+            if severity is not None:
+                log_record["severity"] = severity
 
     # Format string defines which built-in fields to include
     # timestamp, name, severity, and message are essential
@@ -212,8 +218,8 @@ class StorageLogger:
         size : int
             Number of bytes read
         """
-        if self.verbose:
-            self.logger.debug(f"Read {size:,} bytes from {path}")
+        if self.verbose and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Read %s bytes from %s", f"{size:,}", path)
 
     def log_write(self, path: str, size: int) -> None:
         """
@@ -226,8 +232,8 @@ class StorageLogger:
         size : int
             Number of bytes written
         """
-        if self.verbose:
-            self.logger.debug(f"Wrote {size:,} bytes to {path}")
+        if self.verbose and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Wrote %s bytes to %s", f"{size:,}", path)
 
     def log_operation(self, operation: str, path: str) -> None:
         """
@@ -243,4 +249,4 @@ class StorageLogger:
         path : str
             File path involved
         """
-        self.logger.info(f"{operation}: {path}")
+        self.logger.info("%s: %s", operation, path)
@@ -0,0 +1,159 @@
+"""
+Serialization of pipeline artifacts (workloads and results).
+
+Objects are pickled with the stdlib C pickler using the highest protocol
+(protocol 5), which frames large binary buffers such as NumPy arrays
+efficiently. Objects the stdlib pickler cannot handle (lambdas, closures,
+dynamically created classes) fall back to dill.
+
+Both writers produce standard pickle streams, so loading always tries the
+stdlib unpickler first and only falls back to dill for streams that need
+dill's custom class resolution. Artifacts written by earlier pipeline
+versions (dill-only) remain loadable.
+
+dill is imported lazily, only when an object or stream actually needs it.
+
+Usage:
+    from util import serialization
+
+    data = serialization.dumps(result)
+    result = serialization.loads(data)
+
+    # Pickle straight into gzip-compressed bytes (for .pkl.gz artifacts)
+    data = serialization.dumps_compressed(result)
+"""
+
+import gzip
+import io
+import pickle
+from collections.abc import Callable
+from typing import Any, BinaryIO
+
+# Protocol used for all pickles written by the pipeline
+PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+# gzip level for compressed pickles. Level 6 (the zlib default) compresses
+# several times faster than gzip's default of 9 for a marginally larger output.
+COMPRESS_LEVEL = 6
+
+# Errors raised by the stdlib pickler for objects that require dill
+_PICKLE_ERRORS = (pickle.PicklingError, TypeError, AttributeError)
+
+# Errors raised by the stdlib unpickler for streams that require dill
+_UNPICKLE_ERRORS = (pickle.UnpicklingError, AttributeError, ImportError)
+
+# Types whose objects the stdlib pickler rejected; later objects of the same
+# type go straight to dill instead of failing part-way through pickle first
+_dill_types: set[type] = set()
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object, preferring stdlib pickle over dill.
+
+    Once an object of a given type needs dill, later objects of that type are
+    pickled with dill directly.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to serialize
+
+    Returns
+    -------
+    bytes
+        Pickled data
+    """
+    obj_type = type(obj)
+    if obj_type not in _dill_types:
+        try:
+            return pickle.dumps(obj, protocol=PICKLE_PROTOCOL)
+        except _PICKLE_ERRORS:
+            _dill_types.add(obj_type)
+
+    import dill
+
+    return dill.dumps(obj, protocol=PICKLE_PROTOCOL)
+
+
+def dumps_compressed(obj: Any) -> bytes:
+    """Serialize an object directly into gzip-compressed bytes.
+
+    The pickle stream is compressed as it is written, so the uncompressed
+    pickle is never held in memory in full. Equivalent to
+    gzip.compress(dumps(obj), compresslevel=COMPRESS_LEVEL).
+
+    Parameters
+    ----------
+    obj : Any
+        Object to serialize
+
+    Returns
+    -------
+    bytes
+        Gzip-compressed pickled data
+    """
+    obj_type = type(obj)
+    if obj_type not in _dill_types:
+        try:
+            return _dump_gzip(pickle.dump, obj)
+        except _PICKLE_ERRORS:
+            _dill_types.add(obj_type)
+
+    import dill
+
+    return _dump_gzip(dill.dump, obj)
+
+
+def _dump_gzip(dump: Callable, obj: Any) -> bytes:
+    """Pickle an object with the given dump function into a gzip stream."""
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=COMPRESS_LEVEL) as gz:
+        dump(obj, gz, protocol=PICKLE_PROTOCOL)
+    return buffer.getvalue()
+
+
+def loads(data: bytes) -> Any:
+    """Deserialize pickled data written by dumps() or by dill.
+
+    Parameters
+    ----------
+    data : bytes
+        Pickled data
+
+    Returns
+    -------
+    Any
+        Deserialized object
+    """
+    try:
+        return pickle.loads(data)
+    except _UNPICKLE_ERRORS:
+        import dill
+
+        return dill.loads(data)
+
+
+def load(file: BinaryIO) -> Any:
+    """Deserialize an object from a readable binary stream.
+
+    The stream must be seekable so it can be rewound for the dill fallback.
+
+    Parameters
+    ----------
+    file : BinaryIO
+        Seekable binary stream positioned at the start of the pickle
+
+    Returns
+    -------
+    Any
+        Deserialized object
+    """
+    start = file.tell()
+    try:
+        return pickle.load(file)
+    except _UNPICKLE_ERRORS:
+        file.seek(start)
+
+        import dill
+
+        return dill.load(file)
@@ -20,11 +20,17 @@ Usage:
     save_bytes(output_path, data)
 """
 
+import functools
 import gzip
+import io
 import logging
 import os
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 if TYPE_CHECKING:
     from epymodelingsuite.telemetry import ExecutionTelemetry
@@ -40,6 +46,27 @@ _storage_logger = StorageLogger(_logger)
 
 # GCS client cache for cloud mode (optimization)
 _gcs_client = None
+_gcs_client_lock = threading.Lock()
+
+# HTTP connections kept open per host by the GCS client. The requests default
+# (10) is below the thread pool sizes used for concurrent loads and saves, which
+# would make workers wait for a free connection or reconnect.
+_GCS_POOL_SIZE = 64
+
+# GCS bucket handles by bucket name, bound to the cached client
+_gcs_buckets: dict = {}
+
+# Bytes fetched per ranged request by open_stream() in cloud mode. The blob
+# reader's default (40 MiB) would download most artifacts whole on the first read.
+_STREAM_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Minimum part size for chunked uploads; the XML multipart upload API rejects
+# smaller parts (except the last one)
+_MIN_UPLOAD_PART_SIZE = 5 * 1024 * 1024
+
+# gzip level used by save_bytes(compress=True); the zlib default trades a
+# slightly larger file for much faster compression than gzip's default of 9
+_GZIP_COMPRESS_LEVEL = 6
 
 
 def _get_execution_mode() -> str:
@@ -57,7 +84,8 @@ def _get_gcs_client():
 
     Returns a cached google.cloud.storage.Client instance to avoid
     creating new clients on every operation. This improves performance
-    for high-frequency operations.
+    for high-frequency operations. The client is shared by all threads, so its
+    HTTP connection pool is sized for the thread pools used by this module.
 
     Returns
     -------
@@ -66,12 +94,85 @@ def _get_gcs_client():
     """
     global _gcs_client
     if _gcs_client is None:
-        from google.cloud import storage
-
-        _gcs_client = storage.Client()
+        with _gcs_client_lock:
+            if _gcs_client is None:
+                from google.cloud import storage
+                from requests.adapters import HTTPAdapter
+
+                client = storage.Client()
+                client._http.mount(
+                    "https://",
+                    HTTPAdapter(pool_connections=_GCS_POOL_SIZE, pool_maxsize=_GCS_POOL_SIZE),
+                )
+                _gcs_client = client
     return _gcs_client
 
 
+def _get_gcs_bucket(bucket_name: str):
+    """Get or create a cached bucket handle on the cached GCS client.
+
+    Parameters
+    ----------
+    bucket_name : str
+        GCS bucket name
+
+    Returns
+    -------
+    google.cloud.storage.Bucket
+        Cached bucket handle (no API request is made to create it)
+    """
+    bucket = _gcs_buckets.get(bucket_name)
+    if bucket is None:
+        bucket = _gcs_buckets[bucket_name] = _get_gcs_client().bucket(bucket_name)
+    return bucket
+
+
+def _get_parallel_threshold() -> int:
+    """Get the blob size (bytes) above which cloud uploads are chunked (0 disables)."""
+    return int(os.getenv("GCS_PARALLEL_THRESHOLD", str(8 * 1024 * 1024)))
+
+
+def _upload_chunks_concurrently(bucket, blob_name: str, data: bytes, content_type: str) -> None:
+    """Upload data as concurrent parts of a GCS XML multipart upload.
+
+    A single upload stream is limited by one connection's throughput; the data
+    is split into up to GCS_MAX_CONCURRENCY parts uploaded in parallel, which
+    GCS assembles into the final object when the upload completes. No temporary objects are created,
+    and a failed upload is cancelled by the transfer manager.
+
+    Parameters
+    ----------
+    bucket : google.cloud.storage.Bucket
+        Bucket to upload to
+    blob_name : str
+        Name of the final blob
+    data : bytes
+        Blob contents
+    content_type : str
+        MIME content type of the final blob
+    """
+    from google.cloud.storage import transfer_manager
+
+    max_workers = int(os.getenv("GCS_MAX_CONCURRENCY", "16"))
+    chunk_size = max(_MIN_UPLOAD_PART_SIZE, -(-len(data) // max_workers))
+
+    # The multipart upload API reads parts from a file on disk, so the payload
+    # is staged in TMPDIR (held in memory a second time where /tmp is tmpfs).
+    # Threads share the cached client (and its connection pool); worker
+    # processes would each have to rebuild it.
+    with tempfile.NamedTemporaryFile(prefix="gcs-upload-") as staged:
+        staged.write(data)
+        staged.flush()
+        transfer_manager.upload_chunks_concurrently(
+            staged.name,
+            bucket.blob(blob_name),
+            content_type=content_type,
+            chunk_size=chunk_size,
+            worker_type=transfer_manager.THREAD,
+            max_workers=max_workers,
+        )
+
+
 def _detect_content_type(path: str) -> str:
     """Detect MIME content type from file path extension.
 
@@ -118,6 +219,37 @@ def _detect_content_type(path: str) -> str:
     return "application/octet-stream"
 
 
+def _get_exp_id() -> str:
+    """Get EXP_ID from the environment, raising ValueError if it is not set."""
+    exp_id = os.getenv("EXP_ID")
+    if not exp_id:
+        raise ValueError(
+            "EXP_ID environment variable is required but not set. "
+            "Set it before running: export EXP_ID=your-experiment-id"
+        )
+    return exp_id
+
+
+def _get_run_id() -> str:
+    """Get RUN_ID from the environment ("unknown" if not set or empty)."""
+    return os.getenv("RUN_ID") or "unknown"
+
+
+@functools.lru_cache(maxsize=16)
+def _path_prefix(mode: str, dir_prefix: str, exp_id: str, run_id: str) -> str:
+    """Build the "{dir_prefix}/{exp_id}/{run_id}" path prefix for a mode (cached).
+
+    Keyed on the environment values themselves, so a changed environment
+    yields a new prefix instead of a stale one.
+    """
+    prefix = "/".join([dir_prefix.rstrip("/"), exp_id, run_id])
+    if mode == "local":
+        # Prefix with "bucket/" for local mode
+        return "bucket/" + prefix
+    # No bucket prefix for cloud mode
+    return prefix
+
+
 def get_config() -> dict:
     """Get storage configuration from environment variables.
 
@@ -136,21 +268,11 @@ def get_config() -> dict:
     ValueError
         If EXP_ID is not set in environment
     """
-    exp_id = os.getenv("EXP_ID")
-    if not exp_id:
-        raise ValueError(
-            "EXP_ID environment variable is required but not set. "
-            "Set it before running: export EXP_ID=your-experiment-id"
-        )
-
-    # Get RUN_ID - if not set or empty, use "unknown"
-    run_id = os.getenv("RUN_ID") or "unknown"
-
     return {
         "mode": _get_execution_mode(),
         "bucket": os.getenv("GCS_BUCKET", ""),
-        "exp_id": exp_id,
-        "run_id": run_id,
+        "exp_id": _get_exp_id(),
+        "run_id": _get_run_id(),
         "dir_prefix": os.getenv("DIR_PREFIX", "pipeline/flu/").rstrip("/"),
     }
 
@@ -180,19 +302,13 @@ def get_path(*parts: str) -> str:
     # Local: "bucket/pipeline/flu/test-sim/run-20241015/builder-artifacts/input_0000.pkl"
     # Cloud: "pipeline/flu/test-sim/run-20241015/builder-artifacts/input_0000.pkl"
     """
-    config = get_config()
-    mode = config["mode"]
-
-    # Build the base path structure using DIR_PREFIX
-    base_parts = [config["dir_prefix"], config["exp_id"], config["run_id"]]
-    full_parts = base_parts + list(parts)
-
-    if mode == "local":
-        # Prefix with "bucket/" for local mode
-        return "bucket/" + "/".join(full_parts)
-    else:
-        # No bucket prefix for cloud mode
-        return "/".join(full_parts)
+    prefix = _path_prefix(
+        _get_execution_mode(),
+        os.getenv("DIR_PREFIX", "pipeline/flu/"),
+        _get_exp_id(),
+        _get_run_id(),
+    )
+    return "/".join((prefix, *parts))
 
 
 def _resolve_storage_location(path: str) -> tuple[str | None, str]:
@@ -216,15 +332,14 @@ def _resolve_storage_location(path: str) -> tuple[str | None, str]:
     tuple[Optional[str], str]
         Tuple of (bucket_name, final_path)
     """
-    config = get_config()
-    mode = config["mode"]
-
-    if mode == "local":
+    # Only the mode and bucket are needed here, so read them directly instead
+    # of building the full get_config() dict on every I/O call
+    if _get_execution_mode() == "local":
         # Local mode: use path as-is
         return None, path
     else:
         # Cloud mode: get bucket from env and clean path
-        bucket = config["bucket"]
+        bucket = os.getenv("GCS_BUCKET", "")
         if not bucket:
             raise ValueError("Cloud mode requires GCS_BUCKET environment variable to be set")
 
@@ -258,7 +373,7 @@ def load_bytes(path: str, decompress: bool | None = None) -> bytes:
     Raises
     ------
     FileNotFoundError
-        If file doesn't exist
+        If file doesn't exist (in both modes)
     ValueError
         In cloud mode if GCS_BUCKET not set
     Exception
@@ -280,11 +395,16 @@ def load_bytes(path: str, decompress: bool | None = None) -> bytes:
 
     else:
         # Cloud mode - use GCS
-        client = _get_gcs_client()
-        bucket = client.bucket(bucket_name)
-        blob = bucket.blob(final_path)
+        bucket = _get_gcs_bucket(bucket_name)
+
+        from google.api_core.exceptions import NotFound
 
-        data = blob.download_as_bytes()
+        try:
+            data = bucket.blob(final_path).download_as_bytes()
+        except NotFound:
+            raise FileNotFoundError(
+                f"GCS object not found: gs://{bucket_name}/{final_path}"
+            ) from None
         _storage_logger.log_read(f"gs://{bucket_name}/{final_path}", len(data))
 
     # Auto-detect decompression from filename if not explicitly set
@@ -298,10 +418,74 @@ def load_bytes(path: str, decompress: bool | None = None) -> bytes:
     return data
 
 
+def open_stream(path: str) -> BinaryIO:
+    """Open a file in storage as a readable binary stream.
+
+    Unlike load_bytes(), the file contents are not materialized in memory, so
+    callers can decompress and deserialize incrementally while reading.
+    The stream is returned as-is (no automatic gzip decompression).
+
+    In cloud mode: Returns a streaming reader over the GCS blob that fetches
+    4 MiB ranges as the caller reads
+    In local mode: Returns the opened file from /data/{path}
+
+    Parameters
+    ----------
+    path : str
+        Storage path (generated by get_path() or custom)
+
+    Returns
+    -------
+    BinaryIO
+        Readable binary file object (use as a context manager to close it)
+
+    Raises
+    ------
+    FileNotFoundError
+        If file doesn't exist (in both modes)
+    ValueError
+        In cloud mode if GCS_BUCKET not set
+    Exception
+        For GCS errors in cloud mode
+    """
+    mode = _get_execution_mode()
+    bucket_name, final_path = _resolve_storage_location(path)
+
+    if mode == "local":
+        # Local filesystem mode
+        file_path = _get_local_base_path() / final_path
+        try:
+            stream = open(file_path, "rb")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Local file not found: {file_path}") from None
+        return stream
+
+    else:
+        # Cloud mode - use GCS
+        bucket = _get_gcs_bucket(bucket_name)
+        blob = bucket.blob(final_path)
+
+        from google.api_core.exceptions import NotFound
+
+        # The blob reader only requests data on the first read, so fetch the
+        # first chunk here to report a missing object as FileNotFoundError
+        stream = io.BufferedReader(blob.open("rb", chunk_size=_STREAM_CHUNK_SIZE))
+        try:
+            stream.peek(1)
+        except NotFound:
+            stream.close()
+            raise FileNotFoundError(
+                f"GCS object not found: gs://{bucket_name}/{final_path}"
+            ) from None
+        return stream
+
+
 def save_bytes(path: str, data: bytes, compress: bool | None = None, content_type: str | None = None) -> None:
     """Save bytes to storage.
 
-    In cloud mode: Uploads to GCS bucket (using GCS_BUCKET env var)
+    In cloud mode: Uploads to GCS bucket (using GCS_BUCKET env var). Data larger
+    than GCS_PARALLEL_THRESHOLD bytes (default: 8 MiB, 0 disables) is uploaded as
+    up to GCS_MAX_CONCURRENCY (default: 16) concurrent parts of a multipart upload.
     In local mode: Writes to local filesystem at /data/{path}
 
     Parameters
@@ -337,7 +521,7 @@ def save_bytes(path: str, data: bytes, compress: bool | None = None, content_typ
 
     # Compress data if requested
     if compress:
-        data = gzip.compress(data)
+        data = gzip.compress(data, compresslevel=_GZIP_COMPRESS_LEVEL)
 
     # Auto-detect content type from filename if not explicitly set
     if content_type is None:
@@ -356,14 +540,71 @@ def save_bytes(path: str, data: bytes, compress: bool | None = None, content_typ
 
     else:
         # Cloud mode - use GCS
-        client = _get_gcs_client()
-        bucket = client.bucket(bucket_name)
-        blob = bucket.blob(final_path)
+        bucket = _get_gcs_bucket(bucket_name)
 
-        blob.upload_from_string(data, content_type=content_type)
+        threshold = _get_parallel_threshold()
+        if 0 < threshold < len(data):
+            _upload_chunks_concurrently(bucket, final_path, data, content_type)
+        else:
+            bucket.blob(final_path).upload_from_string(data, content_type=content_type)
         _storage_logger.log_write(f"gs://{bucket_name}/{final_path}", len(data))
 
 
+def save_bytes_many(items: Iterable[tuple[str, bytes, bool | None]], max_workers: int = 16) -> int:
+    """Save many independent files to storage concurrently.
+
+    Each item is saved with save_bytes() on a shared thread pool. All uploads
+    reuse the cached GCS client (and its connection pool) in cloud mode. At
+    most 2 * max_workers items are submitted at a time, so a lazy iterable is
+    only consumed as uploads finish and its payloads are not all held at once.
+
+    Parameters
+    ----------
+    items : Iterable[tuple[str, bytes, bool | None]]
+        (path, data, compress) tuples, with the same meaning as the
+        save_bytes() arguments. Consumed lazily as uploads complete.
+    max_workers : int, optional
+        Maximum number of concurrent uploads (default: 16)
+
+    Returns
+    -------
+    int
+        Number of files saved
+
+    Raises
+    ------
+    ValueError
+        In cloud mode if GCS_BUCKET not set
+    Exception
+        For I/O or GCS errors; the first failed upload is re-raised after the
+        uploads already submitted have finished (no further items are consumed)
+    """
+    window = 2 * max_workers
+    saved = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for path, data, compress in items:
+            pending.add(executor.submit(save_bytes, path, data, compress=compress))
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+                    saved += 1
+
+        for future in as_completed(pending):
+            future.result()
+            saved += 1
+
+    return saved
+
+
+def _encode_json(data: dict) -> bytes:
+    """Encode a dictionary as pretty-printed (2-space indented) JSON bytes."""
+    import json
+
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
 def save_json(path: str, data: dict) -> None:
     """Save dictionary as JSON file to storage.
 
@@ -381,10 +622,7 @@ def save_json(path: str, data: dict) -> None:
     Exception
         For I/O or GCS errors
     """
-    import json
-
-    json_bytes = json.dumps(data, indent=2).encode("utf-8")
-    save_bytes(path, json_bytes)
+    save_bytes(path, _encode_json(data))
 
 
 def load_json(path: str) -> dict:
@@ -405,14 +643,16 @@ def load_json(path: str) -> dict:
     FileNotFoundError
         If file doesn't exist
     ValueError
-        In cloud mode if GCS_BUCKET not set
+        In cloud mode if GCS_BUCKET not set, or if the file is not valid JSON
     Exception
-        For GCS errors or JSON parsing errors
+        For GCS errors
     """
     import json
 
     json_bytes = load_bytes(path)
-    return json.loads(json_bytes.decode("utf-8"))
+
+    # json.loads accepts UTF-8 bytes directly, avoiding a decoded str copy
+    return json.loads(json_bytes)
 
 
 def save_telemetry_summary(
@@ -459,22 +699,94 @@ def save_telemetry_summary(
     if "/" in summary_name or "\\" in summary_name:
         raise ValueError(f"Invalid summary_name: must not contain path separators: {summary_name}")
 
-    # Save as JSON
     json_path = get_path("summaries", "json", f"{summary_name}.json")
-    save_json(json_path, telemetry.to_dict())
-    if verbose:
-        _logger.debug(f"Saved JSON summary: {json_path}")
-
-    # Save as TXT
     txt_path = get_path("summaries", "txt", f"{summary_name}.txt")
-    txt_content = telemetry.to_text()
-    save_bytes(txt_path, txt_content.encode("utf-8"))
+
+    # Upload both formats concurrently (one round-trip instead of two in cloud mode)
+    save_bytes_many(
+        [
+            (json_path, _encode_json(telemetry.to_dict()), None),
+            (txt_path, telemetry.to_text().encode("utf-8"), None),
+        ],
+        max_workers=2,
+    )
     if verbose:
-        _logger.debug(f"Saved TXT summary: {txt_path}")
+        _logger.debug("Saved JSON summary: %s", json_path)
+        _logger.debug("Saved TXT summary: %s", txt_path)
 
     return json_path, txt_path
 
 
+def list_prefix(prefix: str) -> set[str]:
+    """List the storage paths of files whose path starts with a prefix.
+
+    Unlike list_blobs(), this does not recurse: in local mode only the
+    directory containing the prefix is scanned. It is meant for checking
+    which of many sibling files exist with one listing instead of one
+    request per file.
+
+    In cloud mode: Lists blobs in the GCS bucket (using GCS_BUCKET env var)
+    In local mode: Scans the directory at /data/{dirname(prefix)}
+
+    Parameters
+    ----------
+    prefix : str
+        Storage path prefix (generated by get_path() or custom), e.g.
+        get_path("runner-artifacts", "result_")
+
+    Returns
+    -------
+    set[str]
+        Storage paths of matching files, in the same form as get_path() output
+
+    Raises
+    ------
+    ValueError
+        In cloud mode if GCS_BUCKET not set
+    Exception
+        For GCS errors in cloud mode
+    """
+    mode = _get_execution_mode()
+    bucket_name, final_path = _resolve_storage_location(prefix)
+
+    if mode == "local":
+        # Local filesystem mode
+        dir_part, _, name_prefix = final_path.rpartition("/")
+        try:
+            with os.scandir(_get_local_base_path() / dir_part) as entries:
+                names = [
+                    entry.name
+                    for entry in entries
+                    if entry.name.startswith(name_prefix) and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return set()
+        return {f"{dir_part}/{name}" if dir_part else name for name in names}
+
+    else:
+        # Cloud mode - use GCS
+        bucket = _get_gcs_bucket(bucket_name)
+
+        return {blob.name for blob in bucket.list_blobs(prefix=final_path)}
+
+
+def _walk_files(root: str) -> Iterator[str]:
+    """Yield the paths of all files below a directory.
+
+    Uses os.scandir so file/directory checks come from the directory entries
+    instead of a stat per path. Like Path.rglob, symlinked directories are
+    not descended into.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
+
 def list_blobs(bucket_name: str | None, prefix: str = "") -> list[str]:
     """
     List all blob paths in storage with given prefix.
@@ -500,20 +812,15 @@ def list_blobs(bucket_name: str | None, prefix: str = "") -> list[str]:
             return []
 
         # Find all files recursively under the prefix path
-        files = []
         if search_path.is_file():
-            files = [str(search_path.relative_to(base_path))]
-        else:
-            for file_path in search_path.rglob("*"):
-                if file_path.is_file():
-                    files.append(str(file_path.relative_to(base_path)))
+            return [str(search_path.relative_to(base_path))]
 
-        return sorted(files)
+        base = str(base_path)
+        return sorted(os.path.relpath(path, base) for path in _walk_files(str(search_path)))
 
     else:
         # Cloud mode - use GCS
-        client = _get_gcs_client()
-        bucket = client.bucket(bucket_name)
+        bucket = _get_gcs_bucket(bucket_name)
         blobs = bucket.list_blobs(prefix=prefix)
 
         return sorted([blob.name for blob in blobs])
@@ -10,15 +10,29 @@ Syntax:
 Two-phase approach: on_page_markdown stores card data and emits a
 placeholder that survives markdown processing; on_page_content replaces
 placeholders with final HTML (avoiding abbr/other extension interference).
+Before any page is rendered, on_files fetches the metadata for every card URL
+in the site concurrently, so rendering only reads from the cache.
+
+Fetched metadata is saved to .cache/link_card_meta.json after each build and
+reused by later builds (including mkdocs serve restarts) for up to 7 days.
 """
 
 import html
+import json
+import os
 import re
-import urllib.request
+import time
 import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from urllib.parse import urlparse
 
 _meta_cache: dict[str, tuple[str | None, str | None]] = {}  # url → (title, desc)
+_fetched_at: dict[str, float] = {}  # url → fetch time (epoch seconds)
+
+_CACHE_FILE = Path(__file__).resolve().parent.parent / ".cache" / "link_card_meta.json"
+_CACHE_TTL = 7 * 24 * 3600  # seconds
 
 # Cards pending render, keyed by placeholder id
 _pending: dict[str, tuple[str, dict[str, str]]] = {}
@@ -33,6 +47,10 @@ _COMMENT = re.compile(
 _PLACEHOLDER = re.compile(r"<!-- LC#(\d+) -->")
 
 
+_META_TAG = re.compile(r"<meta\b([^>]*)>", re.IGNORECASE)
+_ATTR = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+_TITLE_TAG = re.compile(r"<title[^>]*>([^<]+)</title>", re.IGNORECASE)
+
 _OPT_PATTERN = re.compile(r'(\w+)\s*=\s*(?:"([^"]*?)"|(\S+))')
 
 
@@ -43,6 +61,39 @@ def _parse_options(raw: str | None) -> dict[str, str]:
             for m in _OPT_PATTERN.finditer(raw)}
 
 
+def _load_cache() -> None:
+    """Load unexpired metadata saved by a previous build."""
+    cutoff = time.time() - _CACHE_TTL
+    try:
+        saved = json.loads(_CACHE_FILE.read_text(encoding="utf-8"))
+        for url, (title, desc, fetched_at) in saved.items():
+            if fetched_at >= cutoff:
+                _meta_cache[url] = (title, desc)
+                _fetched_at[url] = fetched_at
+    except (OSError, ValueError, TypeError, AttributeError):
+        # Missing or unreadable cache: fetch everything again
+        pass
+
+
+def _save_cache() -> None:
+    """Save fetched metadata; failed fetches are not saved so they are retried."""
+    saved = {
+        url: [title, desc, _fetched_at[url]]
+        for url, (title, desc) in _meta_cache.items()
+        if (title or desc) and url in _fetched_at
+    }
+    try:
+        _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _CACHE_FILE.with_suffix(".tmp")
+        tmp.write_text(json.dumps(saved, indent=2), encoding="utf-8")
+        os.replace(tmp, _CACHE_FILE)
+    except OSError:
+        pass
+
+
+_load_cache()
+
+
 def _fetch_meta(url: str) -> tuple[str | None, str | None]:
     """Fetch title and description from a URL. Returns (title, description)."""
     if url in _meta_cache:
@@ -58,51 +109,34 @@ def _fetch_meta(url: str) -> tuple[str | None, str | None]:
         _meta_cache[url] = (None, None)
         return (None, None)
 
+    # Collect og:title, og:description and description in one pass over the
+    # <meta> tags, whatever their attribute order
+    meta: dict[str, str] = {}
+    for tag in _META_TAG.finditer(data):
+        attrs = {
+            a.group(1).lower(): a.group(2) if a.group(2) is not None else a.group(3)
+            for a in _ATTR.finditer(tag.group(1))
+        }
+        key = (attrs.get("property") or attrs.get("name") or "").lower()
+        content = attrs.get("content")
+        if key in ("og:title", "og:description", "description") and content:
+            meta.setdefault(key, content)
+
     # Title: og:title → <title>
-    m = re.search(
-        r'<meta\s+(?:property|name)=["\']og:title["\']\s+content=["\']([^"\']+)["\']',
-        data,
-        re.IGNORECASE,
-    )
-    if not m:
-        m = re.search(
-            r'<meta\s+content=["\']([^"\']+)["\']\s+(?:property|name)=["\']og:title["\']',
-            data,
-            re.IGNORECASE,
-        )
-    if not m:
-        m = re.search(r"<title[^>]*>([^<]+)</title>", data, re.IGNORECASE)
-    title = html.unescape(m.group(1).strip()) if m else None
+    title = meta.get("og:title")
+    if title is None:
+        m = _TITLE_TAG.search(data)
+        title = m.group(1) if m else None
+    title = html.unescape(title.strip()) if title else None
     if title:
-        title = re.sub(r"^GitHub - ", "", title)
+        title = title.removeprefix("GitHub - ")
 
     # Description: og:description → <meta name="description">
-    d = re.search(
-        r'<meta\s+(?:property|name)=["\']og:description["\']\s+content=["\']([^"\']+)["\']',
-        data,
-        re.IGNORECASE,
-    )
-    if not d:
-        d = re.search(
-            r'<meta\s+content=["\']([^"\']+)["\']\s+(?:property|name)=["\']og:description["\']',
-            data,
-            re.IGNORECASE,
-        )
-    if not d:
-        d = re.search(
-            r'<meta\s+name=["\']description["\']\s+content=["\']([^"\']+)["\']',
-            data,
-            re.IGNORECASE,
-        )
-    if not d:
-        d = re.search(
-            r'<meta\s+content=["\']([^"\']+)["\']\s+name=["\']description["\']',
-            data,
-            re.IGNORECASE,
-        )
-    desc = html.unescape(d.group(1).strip()) if d else None
+    desc = meta.get("og:description") or meta.get("description")
+    desc = html.unescape(desc.strip()) if desc else None
 
     _meta_cache[url] = (title, desc)
+    _fetched_at[url] = time.time()
     return (title, desc)
 
 
@@ -127,11 +161,20 @@ def _clean_github_desc(desc: str, repo: str) -> str:
     return desc.strip()
 
 
+def _needs_fetch(url: str, opts: dict[str, str]) -> bool:
+    """Return False if the options (or a GitHub repo URL) give both title and description."""
+    needs_title = "title" not in opts and _github_repo_path(urlparse(url)) is None
+    return needs_title or not opts.get("description")
+
+
 def _build_card(url: str, opts: dict[str, str]) -> str:
     parsed = urlparse(url)
     domain = parsed.hostname or parsed.netloc
 
-    fetched_title, fetched_desc = _fetch_meta(url)
+    if _needs_fetch(url, opts):
+        fetched_title, fetched_desc = _fetch_meta(url)
+    else:
+        fetched_title, fetched_desc = None, None
     gh_repo = _github_repo_path(parsed)
 
     if "title" in opts:
@@ -187,6 +230,22 @@ def _build_card(url: str, opts: dict[str, str]) -> str:
     )
 
 
+# Phase 0: prefetch metadata for all cards in the site concurrently
+def on_files(files, **kwargs):
+    urls = set()
+    for page in files.documentation_pages():
+        for m in _COMMENT.finditer(page.content_string):
+            url = m.group(1).strip()
+            if _needs_fetch(url, _parse_options(m.group(2))):
+                urls.add(url)
+    urls.difference_update(_meta_cache)
+    if urls:
+        # Fetches are network-bound; overlap them instead of paying each timeout in turn
+        with ThreadPoolExecutor(max_workers=min(16, len(urls))) as executor:
+            list(executor.map(_fetch_meta, urls))
+    return files
+
+
 # Phase 1: replace comment with a placeholder that markdown won't touch
 def on_page_markdown(markdown: str, **kwargs) -> str:
     global _counter
@@ -214,3 +273,7 @@ def on_page_content(html_content: str, **kwargs) -> str:
         return _build_card(url, opts)
 
     return _PLACEHOLDER.sub(_replace, html_content)
+
+
+def on_post_build(**kwargs) -> None:
+    _save_cache()
@@ -9,10 +9,22 @@ on_post_build:
   - Generates site/llms-full.txt by concatenating all nav pages.
 """
 
+import functools
+import os
+import posixpath
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
 
+# Fenced code block (group 1) or markdown link (text: group 2, url: group 3),
+# matched in a single pass so links inside code blocks are left untouched
+_FENCE_OR_LINK = re.compile(r"(```[\s\S]*?```|~~~[\s\S]*?~~~)|\[([^\]]*)\]\(([^)]+)\)")
+
+# Pages in the same directory share link targets, so normalize each path once
+_normpath = functools.lru_cache(maxsize=None)(posixpath.normpath)
+
 
 class _PermissiveLoader(yaml.SafeLoader):
     """SafeLoader that ignores !!python/name and similar custom tags."""
@@ -65,13 +77,13 @@ def _resolve_relative_links(content: str, md_rel: Path, site_url: str) -> str:
 
     Skips links inside fenced code blocks and inline code spans.
     """
-    import re
-    from posixpath import normpath
-
     base_dir = str(md_rel.parent)
 
-    def _replace_link(m: re.Match) -> str:
-        text, url = m.group(1), m.group(2)
+    def _replace(m: re.Match) -> str:
+        # Fenced code blocks match the first alternative and are kept as-is
+        if m.group(1) is not None:
+            return m.group(0)
+        text, url = m.group(2), m.group(3)
         if url.startswith(("http://", "https://", "#", "mailto:")):
             return m.group(0)
         anchor = ""
@@ -79,16 +91,11 @@ def _resolve_relative_links(content: str, md_rel: Path, site_url: str) -> str:
             url, anchor = url.rsplit("#", 1)
             anchor = "#" + anchor
         if url:
-            resolved = normpath(f"{base_dir}/{url}") if base_dir != "." else normpath(url)
+            resolved = _normpath(f"{base_dir}/{url}") if base_dir != "." else _normpath(url)
             return f"[{text}]({site_url}/{resolved}{anchor})"
         return f"[{text}](#{anchor[1:]})"
 
-    # Split on fenced code blocks only, then rewrite links in non-code segments
-    parts = re.split(r"(```[\s\S]*?```|~~~[\s\S]*?~~~)", content)
-    for i, part in enumerate(parts):
-        if i % 2 == 0:  # non-code segment
-            parts[i] = re.sub(r"\[([^\]]*)\]\(([^)]+)\)", _replace_link, part)
-    return "".join(parts)
+    return _FENCE_OR_LINK.sub(_replace, content)
 
 
 def on_post_build(config, **kwargs) -> None:
@@ -109,7 +116,8 @@ def on_post_build(config, **kwargs) -> None:
         f"<!-- Documentation index: {site_url}/llms.txt -->\n"
         f"<!-- Full documentation: {site_url}/llms-full.txt -->\n\n"
     )
-    for md_file in docs_dir.rglob("*.md"):
+
+    def _copy_md(md_file: Path) -> None:
         rel = md_file.relative_to(docs_dir)
         dest = site_dir / rel
         dest.parent.mkdir(parents=True, exist_ok=True)
@@ -117,6 +125,13 @@ def on_post_build(config, **kwargs) -> None:
         content = _resolve_relative_links(content, rel, site_url)
         dest.write_text(llms_comment + content, encoding="utf-8")
 
+    # Files are independent, so overlap their reads and writes on a thread pool
+    md_files = list(docs_dir.rglob("*.md"))
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2)) as executor:
+        # Consume the results so a failed copy is raised here
+        for _ in executor.map(_copy_md, md_files):
+            pass
+
     # 2. Generate llms.txt from nav structure
     parts = [f"# {site_name}", "", f"> {site_description}"]
     parts.extend(_extract_llms_txt(nav, site_url))
@@ -124,15 +139,15 @@ def on_post_build(config, **kwargs) -> None:
     (site_dir / "llms.txt").write_text("\n".join(parts), encoding="utf-8")
 
     # 3. Generate llms-full.txt by concatenating all nav pages
+    # Pages are read and written one at a time rather than joined into one large string
     entries = _walk_nav_titled(nav)
-    full_parts: list[str] = []
-    for title, md_path in entries:
-        source = docs_dir / md_path
-        if not source.exists():
-            continue
-        content = source.read_text(encoding="utf-8").strip()
-        full_parts.append(f"# {title}\n\n{content}")
-
-    (site_dir / "llms-full.txt").write_text(
-        "\n\n---\n\n".join(full_parts) + "\n", encoding="utf-8"
-    )
+    with open(site_dir / "llms-full.txt", "w", encoding="utf-8") as f:
+        separator = ""
+        for title, md_path in entries:
+            source = docs_dir / md_path
+            if not source.exists():
+                continue
+            f.write(f"{separator}# {title}\n\n")
+            f.write(source.read_text(encoding="utf-8").strip())
+            separator = "\n\n---\n\n"
+        f.write("\n")
@@ -3,6 +3,7 @@
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 import numpy as np
 from PIL import Image as PILImage
 from epydemix import load_predefined_model
@@ -22,26 +23,28 @@ st = results.get_stacked_transitions()
 infections = st["Susceptible_to_Infected_total"]
 
 # Plot trajectories (white on transparent)
-fig = plt.figure(figsize=(12, 6.3), dpi=200)
+# Rendered directly at card size (1200x630)
+fig = plt.figure(figsize=(12, 6.3), dpi=100)
 ax = fig.add_axes([0, 0, 1, 1])
 ax.patch.set_alpha(0)
 fig.patch.set_alpha(0)
 
-for i in range(infections.shape[0]):
-    ax.plot(infections[i], color="white", alpha=0.1, linewidth=0.4)
+# All trajectories as one collection (one artist instead of one per line)
+x = np.broadcast_to(np.arange(infections.shape[1]), infections.shape)
+segments = np.stack([x, infections], axis=-1)
+ax.add_collection(LineCollection(segments, colors="white", alpha=0.1, linewidths=0.4))
 
 ax.set_xlim(0, infections.shape[1] - 1)
 ax.set_ylim(5, infections.max() * 1.15)
 ax.axis("off")
 
-fig.savefig(OUTPUT, dpi=200, transparent=True)
+# Take the rendered RGBA pixels from the canvas (no intermediate PNG on disk)
+fig.canvas.draw()
+rgba = np.array(fig.canvas.buffer_rgba())
 plt.close()
 
-# Downscale to card size (1200x630) and reduce overall opacity to 25%
-img = PILImage.open(OUTPUT).convert("RGBA")
-img = img.resize((1200, 630), PILImage.LANCZOS)
-r, g, b, a = img.split()
-a = a.point(lambda x: int(x * 0.25))
-img = PILImage.merge("RGBA", (r, g, b, a))
+# Reduce overall opacity to 25%
+rgba[..., 3] //= 4
+img = PILImage.fromarray(rgba, "RGBA")
 img.save(OUTPUT)
 print(f"Saved {OUTPUT} ({img.size[0]}x{img.size[1]})")
@@ -7,6 +7,14 @@ import pytest
 from util import config
 
 
+@pytest.fixture(autouse=True)
+def clear_config_caches():
+    """Reset config module caches so tests don't see each other's directories."""
+    config.clear_caches()
+    yield
+    config.clear_caches()
+
+
 @pytest.mark.unit
 class TestResolveConfigs:
     """Tests for resolve_configs() function."""
@@ -84,6 +92,19 @@ model:
                 "nonexistent-exp", config_dir=str(temp_local_path / "experiments")
             )
 
+    def test_resolve_configs_finds_directory_created_after_miss(self, temp_local_path):
+        """Test a failed lookup is not cached, so a later-created experiment is found."""
+        (temp_local_path / "a").mkdir()
+        with pytest.raises(FileNotFoundError, match="Config directory not found"):
+            config.resolve_configs("my-exp", config_dir=str(temp_local_path))
+
+        exp_config_dir = temp_local_path / "a" / "my-exp" / "config"
+        exp_config_dir.mkdir(parents=True)
+        (exp_config_dir / "basemodel.yaml").write_text("model:\n  name: test\n")
+
+        result = config.resolve_configs("my-exp", config_dir=str(temp_local_path))
+        assert result["basemodel"] == str(exp_config_dir / "basemodel.yaml")
+
     def test_resolve_configs_no_yaml_files(self, temp_local_path):
         """Test resolve_configs raises FileNotFoundError when no YAML files exist."""
         # Create empty config directory
@@ -456,3 +477,212 @@ class TestLoadAllConfigs:
 
         with pytest.raises(ValueError, match="Basemodel config is required"):
             config.load_all_configs(config_paths)
+
+
+@pytest.mark.unit
+class TestIdentifyAll:
+    """Tests for _identify_all() function."""
+
+    def test_identify_all_keeps_order_and_errors(self, temp_local_path):
+        """Test results follow input order and parse errors are returned, not raised."""
+        paths = []
+        for name in ["a.yaml", "b.yaml", "c.yaml"]:
+            path = temp_local_path / name
+            path.write_text("output: {}")
+            paths.append(path)
+
+        def mock_identify(path):
+            if path.endswith("b.yaml"):
+                raise ValueError("bad yaml")
+            return "output"
+
+        with patch("util.config.identify_config_type", side_effect=mock_identify):
+            results = config._identify_all(paths)
+
+        assert [config_type for config_type, _ in results] == ["output", None, "output"]
+        assert isinstance(results[1][1], ValueError)
+
+
+@pytest.mark.unit
+class TestCachedIdentify:
+    """Tests for _cached_identify() function."""
+
+    def test_cached_identify_reuses_result(self, temp_local_path):
+        """Test an unchanged file is only parsed once."""
+        config_file = temp_local_path / "output.yaml"
+        config_file.write_text("output: {}")
+
+        with patch("util.config.identify_config_type", return_value="output") as mock_identify:
+            assert config._cached_identify(str(config_file)) == "output"
+            assert config._cached_identify(str(config_file)) == "output"
+
+        assert mock_identify.call_count == 1
+
+    def test_cached_identify_reparses_changed_file(self, temp_local_path):
+        """Test a file is parsed again after its size changes."""
+        config_file = temp_local_path / "config.yaml"
+        config_file.write_text("model: {}")
+
+        with patch("util.config.identify_config_type", return_value="basemodel"):
+            assert config._cached_identify(str(config_file)) == "basemodel"
+
+        config_file.write_text("output: {meta: {}}")
+
+        with patch("util.config.identify_config_type", return_value="output") as mock_identify:
+            assert config._cached_identify(str(config_file)) == "output"
+
+        assert mock_identify.call_count == 1
+
+
+@pytest.mark.unit
+class TestPeekConfigType:
+    """Tests for _peek_config_type() function."""
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("model:\n  name: test\n  compartments: [{id: S}, {id: I}]\n", "basemodel"),
+            ("modelset:\n  population: {name: US}\n  sampling: {n: 10}\n", "sampling"),
+            ("modelset:\n  calibration:\n    model: {}\n", "calibration"),
+            ("---\nmodel: {}\n...\n", "basemodel"),
+        ],
+    )
+    def test_peek_identifies_structure(self, temp_local_path, content, expected):
+        """Test root and modelset keys identify basemodel and modelset configs."""
+        config_file = temp_local_path / "config.yaml"
+        config_file.write_text(content)
+
+        assert config._peek_config_type(str(config_file)) == expected
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "output: {meta: {}}\n",
+            "model: {}\noutput: {}\n",
+            "modelset:\n  sampling: {}\n  calibration: {}\n",
+            "random: data\n",
+            "model: [unclosed\n",
+            "- model: {}\n",
+            "model: {}\n---\nmodelset: {sampling: {}}\n",
+            "model: {}\n---\nmodel: {}\n",
+        ],
+    )
+    def test_peek_undetermined(self, temp_local_path, content):
+        """Test ambiguous, invalid or multi-document files are left to identify_config_type."""
+        config_file = temp_local_path / "config.yaml"
+        config_file.write_text(content)
+
+        assert config._peek_config_type(str(config_file)) is None
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            pytest.param("model: {}\n---\n" + "key: value\n" * 100, id="second-document"),
+            pytest.param("model: {}\noutput: {}\n" + "key: value\n" * 100, id="second-marker"),
+        ],
+    )
+    def test_peek_stops_parsing_early(self, temp_local_path, monkeypatch, content):
+        """Test parsing stops at the first document end or once the type is ambiguous."""
+        config_file = temp_local_path / "config.yaml"
+        config_file.write_text(content)
+        consumed = []
+        parse = config.yaml.parse
+
+        def counting_parse(stream, **kwargs):
+            for event in parse(stream, **kwargs):
+                consumed.append(event)
+                yield event
+
+        monkeypatch.setattr(config.yaml, "parse", counting_parse)
+
+        assert config._peek_config_type(str(config_file)) is None
+        assert len(consumed) < 20
+
+
+@pytest.mark.unit
+class TestFindNestedConfigDirs:
+    """Tests for _find_nested_config_dirs() function."""
+
+    def test_find_nested_config_dirs(self, temp_local_path):
+        """Test nested experiment config directories are found one level down."""
+        (temp_local_path / "b" / "my-exp" / "config").mkdir(parents=True)
+        (temp_local_path / "a" / "my-exp" / "config").mkdir(parents=True)
+        (temp_local_path / "c" / "other-exp" / "config").mkdir(parents=True)
+
+        found = config._find_nested_config_dirs(str(temp_local_path), "my-exp")
+
+        assert found == [
+            temp_local_path / "a" / "my-exp" / "config",
+            temp_local_path / "b" / "my-exp" / "config",
+        ]
+
+    def test_find_nested_config_dirs_sees_new_subdirectories(self, temp_local_path):
+        """Test the cached base directory listing is refreshed when it changes."""
+        (temp_local_path / "a" / "my-exp" / "config").mkdir(parents=True)
+        assert len(config._find_nested_config_dirs(str(temp_local_path), "my-exp")) == 1
+
+        (temp_local_path / "b" / "my-exp" / "config").mkdir(parents=True)
+        assert len(config._find_nested_config_dirs(str(temp_local_path), "my-exp")) == 2
+
+
+@pytest.mark.unit
+class TestResolveOutputConfig:
+    """Tests for resolve_output_config() function."""
+
+    def test_resolve_output_config_prefers_common_name(self, temp_local_path):
+        """Test output.yaml is used without identifying other files."""
+        config_dir = temp_local_path / "experiments" / "test-exp" / "config"
+        config_dir.mkdir(parents=True)
+        (config_dir / "output.yaml").write_text("output: {}")
+        (config_dir / "basemodel.yaml").write_text("model: {}")
+
+        with patch("util.config.identify_config_type", return_value="output") as mock_identify:
+            path = config.resolve_output_config(
+                "test-exp", config_dir=str(temp_local_path / "experiments")
+            )
+
+        assert path.endswith("output.yaml")
+        assert mock_identify.call_count == 1
+
+    def test_resolve_output_config_scans_output_names_first(self, temp_local_path):
+        """Test output*.yaml files are identified before falling back to all files."""
+        config_dir = temp_local_path / "experiments" / "test-exp" / "config"
+        config_dir.mkdir(parents=True)
+        (config_dir / "output_projection.yaml").write_text("output: {}")
+        (config_dir / "sampling.yaml").write_text("sampling: {}")
+
+        with patch("util.config.identify_config_type", return_value="output") as mock_identify:
+            path = config.resolve_output_config(
+                "test-exp", config_dir=str(temp_local_path / "experiments")
+            )
+
+        assert path.endswith("output_projection.yaml")
+        mock_identify.assert_called_once_with(str(config_dir / "output_projection.yaml"))
+
+    def test_resolve_output_config_falls_back_to_all_files(self, temp_local_path):
+        """Test an output config with another name is found by full auto-detection."""
+        config_dir = temp_local_path / "experiments" / "test-exp" / "config"
+        config_dir.mkdir(parents=True)
+        (config_dir / "projection.yaml").write_text("output: {}")
+
+        with patch("util.config.identify_config_type", return_value="output"):
+            path = config.resolve_output_config(
+                "test-exp", config_dir=str(temp_local_path / "experiments")
+            )
+
+        assert path.endswith("projection.yaml")
+
+    def test_resolve_output_config_trusts_filename_convention(self, temp_local_path, monkeypatch):
+        """Test TRUST_FILENAME_CONVENTION=true skips identifying output.yaml."""
+        monkeypatch.setenv("TRUST_FILENAME_CONVENTION", "true")
+        config_dir = temp_local_path / "experiments" / "test-exp" / "config"
+        config_dir.mkdir(parents=True)
+        (config_dir / "output.yaml").write_text("output: {}")
+
+        with patch("util.config.identify_config_type") as mock_identify:
+            path = config.resolve_output_config(
+                "test-exp", config_dir=str(temp_local_path / "experiments")
+            )
+
+        assert path.endswith("output.yaml")
+        mock_identify.assert_not_called()
@@ -1,6 +1,7 @@
 """Tests for scripts/util/logger.py module."""
 
 import json
+import logging
 
 import pytest
 from util import logger
@@ -58,6 +59,23 @@ class TestSetupLogger:
         captured_warning = capfd.readouterr()
         assert "Warning message" in captured_warning.out
 
+    @pytest.mark.parametrize(
+        ("name", "level"),
+        [
+            ("warn", logging.WARNING),
+            ("FATAL", logging.CRITICAL),
+            ("NOTSET", logging.NOTSET),
+            ("debug", logging.DEBUG),
+            ("verbose", logging.INFO),
+        ],
+    )
+    def test_setup_logger_accepts_level_aliases(self, monkeypatch, name, level):
+        """Test LOG_LEVEL accepts every logging level name, falling back to INFO."""
+        monkeypatch.setenv("EXECUTION_MODE", "local")
+        monkeypatch.setenv("LOG_LEVEL", name)
+
+        assert logger.setup_logger("test-stage").level == level
+
     def test_setup_logger_default_log_level(self, monkeypatch, capfd):
         """Test setup_logger defaults to INFO level."""
         monkeypatch.setenv("EXECUTION_MODE", "local")
@@ -0,0 +1,181 @@
+"""Tests for result loading and output saving in scripts/main_output.py."""
+
+import gzip
+import logging
+import threading
+from types import SimpleNamespace
+
+import pytest
+from util import serialization, storage
+
+pytest.importorskip("epymodelingsuite")
+
+import main_output  # noqa: E402
+from epymodelingsuite.schema.output import TabularOutputTypeEnum  # noqa: E402
+
+logger = logging.getLogger("test_main_output")
+
+
+class FakeSimulationResult:
+    """Picklable stand-in for a Stage B simulation result."""
+
+    def __init__(self, index):
+        self.index = index
+
+
+def _result_file(temp_local_path, task_index):
+    """Return the local file of a task's result pickle."""
+    return temp_local_path / main_output._result_path(task_index)
+
+
+def _write_results(task_indices):
+    """Save gzip-compressed result pickles for the given task indices."""
+    for i in task_indices:
+        data = serialization.dumps_compressed(FakeSimulationResult(i))
+        storage.save_bytes(main_output._result_path(i), data, compress=False)
+
+
+@pytest.mark.unit
+class TestLoadAllResults:
+    """Tests for load_all_results() in local mode."""
+
+    def test_load_all_results_in_task_order(self, mock_env_local):
+        """Test every result is loaded, in task order, with its detected type."""
+        _write_results(range(5))
+
+        results, result_type = main_output.load_all_results(5, logger)
+
+        assert [result.index for result in results] == [0, 1, 2, 3, 4]
+        assert result_type == "simulation"
+
+    def test_strict_mode_missing_result_raises(self, mock_env_local, monkeypatch):
+        """Test a missing result fails strict mode before any file is fetched."""
+        _write_results([0, 2])
+        loaded = []
+        monkeypatch.setattr(main_output, "_load_result", lambda path: loaded.append(path))
+
+        with pytest.raises(ValueError, match=r"Missing result files \(tasks\): \[1\]"):
+            main_output.load_all_results(3, logger, allow_partial=False)
+
+        assert loaded == []
+
+    def test_partial_mode_skips_missing_result(self, mock_env_local):
+        """Test partial mode continues with the results that exist."""
+        _write_results([0, 2])
+
+        results, _ = main_output.load_all_results(3, logger, allow_partial=True)
+
+        assert [result.index for result in results] == [0, 2]
+
+    def test_corrupt_gzip_counted_as_failed(self, mock_env_local, temp_local_path):
+        """Test a corrupt result file is skipped in partial mode."""
+        _write_results(range(3))
+        _result_file(temp_local_path, 1).write_bytes(b"not a gzip stream")
+
+        results, _ = main_output.load_all_results(3, logger, allow_partial=True)
+
+        assert [result.index for result in results] == [0, 2]
+
+    def test_corrupt_gzip_fails_strict_mode(self, mock_env_local, temp_local_path):
+        """Test a corrupt result file fails strict mode as a failed task."""
+        _write_results(range(3))
+        data = _result_file(temp_local_path, 2).read_bytes()
+        _result_file(temp_local_path, 2).write_bytes(data[: len(data) // 2])
+
+        with pytest.raises(ValueError, match=r"Failed to load \(tasks\): \[2\]"):
+            main_output.load_all_results(3, logger, allow_partial=False)
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param(b"\x80\x09\x95\x00", id="unsupported-protocol"),
+            pytest.param(b"\x80\x05K\x01)R.", id="reduce-on-non-callable"),
+            pytest.param(b"plain text, not a pickle", id="not-a-pickle"),
+        ],
+    )
+    def test_gzipped_non_pickle_counted_as_failed(self, mock_env_local, temp_local_path, payload):
+        """Test a valid gzip wrapping a foreign or corrupt pickle is skipped in partial mode."""
+        _write_results(range(3))
+        _result_file(temp_local_path, 1).write_bytes(gzip.compress(payload))
+
+        results, _ = main_output.load_all_results(3, logger, allow_partial=True)
+
+        assert [result.index for result in results] == [0, 2]
+
+    def test_no_results_raises(self, mock_env_local):
+        """Test loading fails when no result could be loaded at all."""
+        with pytest.raises(ValueError, match="No results loaded"):
+            main_output.load_all_results(2, logger, allow_partial=True)
+
+
+@pytest.mark.unit
+class TestIterResults:
+    """Tests for the iter_results() prefetch window."""
+
+    def test_prefetch_window_bounds_submitted_loads(self, monkeypatch):
+        """Test at most 2 * MAX_LOAD_WORKERS loads run ahead of the consumer."""
+        monkeypatch.setattr(main_output, "MAX_LOAD_WORKERS", 1)
+        started = []
+        lock = threading.Lock()
+
+        def load(path):
+            with lock:
+                started.append(path)
+            return path, 0
+
+        monkeypatch.setattr(main_output, "_load_result", load)
+        result_paths = {i: f"result_{i}" for i in range(10)}
+
+        results = main_output.iter_results(result_paths)
+        i, path, future = next(results)
+        assert (i, path, future.result()) == (0, "result_0", ("result_0", 0))
+        assert len(started) <= 2
+
+        # Stopping early cancels loads that have not been submitted or started
+        results.close()
+        assert len(started) <= 2
+
+    def test_yields_load_errors_in_order(self, monkeypatch):
+        """Test failed loads are yielded in task order with the error on the future."""
+
+        def load(path):
+            if path == "result_1":
+                raise gzip.BadGzipFile("corrupt")
+            return path, 0
+
+        monkeypatch.setattr(main_output, "_load_result", load)
+
+        yielded = list(main_output.iter_results({i: f"result_{i}" for i in range(3)}))
+
+        assert [i for i, _, _ in yielded] == [0, 1, 2]
+        assert isinstance(yielded[1][2].exception(), gzip.BadGzipFile)
+
+
+@pytest.mark.unit
+class TestSaveOutputFiles:
+    """Tests for save_output_files() in local mode."""
+
+    def test_saves_byte_outputs_and_skips_in_memory(self, mock_env_local, temp_local_path):
+        """Test byte outputs are saved as-is and in-memory outputs are skipped."""
+        csv_bytes = gzip.compress(b"a,b\n1,2\n")
+        output_dict = {
+            "quantiles": [
+                SimpleNamespace(
+                    name="quantiles.csv.gz",
+                    output_type=TabularOutputTypeEnum.CSVBytes,
+                    data=csv_bytes,
+                ),
+                SimpleNamespace(
+                    name="quantiles_df",
+                    output_type="DataFrame",
+                    data=None,
+                ),
+            ]
+        }
+
+        main_output.save_output_files(output_dict, logger, "20250101-000000")
+
+        saved = temp_local_path / storage.get_path("outputs", "20250101-000000")
+        assert (saved / "quantiles.csv.gz").read_bytes() == csv_bytes  # not double-gzipped
+        assert not (saved / "quantiles_df").exists()
+        assert output_dict == {}
@@ -0,0 +1,102 @@
+"""Tests for scripts/util/serialization.py module."""
+
+import gzip
+import io
+import pickle
+from unittest.mock import patch
+
+import dill
+import pytest
+from util import serialization
+
+
+@pytest.mark.unit
+class TestDumpsLoads:
+    """Tests for dumps() and loads() functions."""
+
+    def test_roundtrip_plain_object(self):
+        """Test dumps/loads roundtrip for stdlib-picklable objects."""
+        data = {"values": [1, 2, 3], "name": "test"}
+
+        assert serialization.loads(serialization.dumps(data)) == data
+
+    def test_dumps_uses_stdlib_pickle_when_possible(self):
+        """Test dumps produces a stdlib pickle for plain objects."""
+        data = serialization.dumps({"key": "value"})
+
+        assert pickle.loads(data) == {"key": "value"}
+
+    def test_dumps_falls_back_to_dill(self):
+        """Test dumps falls back to dill for objects stdlib pickle rejects."""
+        data = serialization.dumps(lambda x: x + 1)
+
+        assert serialization.loads(data)(1) == 2
+
+    def test_dumps_remembers_types_that_need_dill(self, monkeypatch):
+        """Test types rejected by stdlib pickle skip the pickle attempt next time."""
+        monkeypatch.setattr(serialization, "_dill_types", set())
+
+        class Holder:
+            def __init__(self, value):
+                self.value = value
+
+        serialization.dumps(Holder(lambda: 1))
+        assert Holder in serialization._dill_types
+
+        with patch.object(serialization.pickle, "dumps") as mock_dumps:
+            data = serialization.dumps(Holder(lambda: 2))
+
+        mock_dumps.assert_not_called()
+        assert serialization.loads(data).value() == 2
+
+    def test_loads_reads_dill_pickles(self):
+        """Test loads reads artifacts written directly with dill."""
+
+        class LocalClass:
+            value = 42
+
+        data = dill.dumps(LocalClass())
+
+        assert serialization.loads(data).value == 42
+
+
+@pytest.mark.unit
+class TestDumpsCompressed:
+    """Tests for dumps_compressed() function."""
+
+    def test_dumps_compressed_roundtrip(self):
+        """Test dumps_compressed output is a gzip-compressed pickle."""
+        data = {"values": list(range(100))}
+
+        compressed = serialization.dumps_compressed(data)
+
+        assert serialization.loads(gzip.decompress(compressed)) == data
+
+    def test_dumps_compressed_falls_back_to_dill(self):
+        """Test dumps_compressed restarts with dill for objects pickle rejects."""
+        compressed = serialization.dumps_compressed(lambda x: x * 3)
+
+        assert serialization.loads(gzip.decompress(compressed))(2) == 6
+
+
+@pytest.mark.unit
+class TestLoad:
+    """Tests for load() function."""
+
+    def test_load_from_gzip_stream(self):
+        """Test load deserializes from a gzip-decompressing stream."""
+        raw = gzip.compress(serialization.dumps([1, 2, 3]))
+
+        with gzip.GzipFile(fileobj=io.BytesIO(raw), mode="rb") as gz:
+            assert serialization.load(gz) == [1, 2, 3]
+
+    def test_load_falls_back_to_dill(self):
+        """Test load rewinds the stream and retries with dill when needed."""
+
+        class LocalClass:
+            value = 7
+
+        raw = gzip.compress(dill.dumps(LocalClass()))
+
+        with gzip.GzipFile(fileobj=io.BytesIO(raw), mode="rb") as gz:
+            assert serialization.load(gz).value == 7
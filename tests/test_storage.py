@@ -1,6 +1,11 @@
 """Tests for scripts/util/storage.py module."""
 
+import gzip
 import json
+import math
+import os
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -86,6 +91,14 @@ class TestGetPath:
 
         assert path == "bucket/pipeline/test/test-exp/test-run/summaries/json/builder_summary.json"
 
+    def test_get_path_follows_environment_changes(self, mock_env_local, monkeypatch):
+        """Test the cached path prefix is not reused after RUN_ID changes."""
+        assert storage.get_path("summaries") == "bucket/pipeline/test/test-exp/test-run/summaries"
+
+        monkeypatch.setenv("RUN_ID", "other-run")
+
+        assert storage.get_path("summaries") == "bucket/pipeline/test/test-exp/other-run/summaries"
+
 
 @pytest.mark.unit
 @pytest.mark.local
@@ -143,6 +156,108 @@ class TestLoadSaveBytesLocal:
         with pytest.raises(FileNotFoundError, match="Local file not found"):
             storage.load_bytes(path)
 
+    def test_save_bytes_many_saves_all_files(self, mock_env_local, temp_local_path):
+        """Test save_bytes_many saves every item and returns the count."""
+        items = [
+            ("bucket/test/a.txt", b"content a", None),
+            ("bucket/test/b.txt.gz", b"already gzipped", False),
+            ("bucket/test/c.txt.gz", b"compress me", None),
+        ]
+
+        assert storage.save_bytes_many(iter(items), max_workers=2) == 3
+
+        assert (temp_local_path / "bucket/test/a.txt").read_bytes() == b"content a"
+        assert (temp_local_path / "bucket/test/b.txt.gz").read_bytes() == b"already gzipped"
+        assert gzip.decompress((temp_local_path / "bucket/test/c.txt.gz").read_bytes()) == (
+            b"compress me"
+        )
+
+    def test_save_bytes_many_bounds_submitted_items(self, monkeypatch):
+        """Test save_bytes_many consumes at most 2 * max_workers items ahead of uploads."""
+        release = threading.Event()
+        consumed = []
+
+        def slow_save(path, data, compress=None):
+            release.wait(timeout=5)
+
+        def items():
+            for i in range(10):
+                consumed.append(i)
+                yield f"bucket/test/{i}.txt", b"data", None
+
+        monkeypatch.setattr(storage, "save_bytes", slow_save)
+        saved = []
+        worker = threading.Thread(
+            target=lambda: saved.append(storage.save_bytes_many(items(), max_workers=1))
+        )
+        worker.start()
+        time.sleep(0.2)
+        assert len(consumed) == 2
+
+        release.set()
+        worker.join(timeout=5)
+        assert saved == [10]
+
+    def test_save_bytes_many_raises_first_failure(self, monkeypatch):
+        """Test an upload failure propagates and stops consuming further items."""
+        consumed = []
+
+        def failing_save(path, data, compress=None):
+            raise OSError(f"cannot write {path}")
+
+        def items():
+            for i in range(10):
+                consumed.append(i)
+                yield f"bucket/test/{i}.txt", b"data", None
+
+        monkeypatch.setattr(storage, "save_bytes", failing_save)
+
+        with pytest.raises(OSError, match="cannot write"):
+            storage.save_bytes_many(items(), max_workers=1)
+        assert len(consumed) < 10
+
+    def test_open_stream_reads_file(self, mock_env_local, temp_local_path):
+        """Test open_stream returns a readable stream without decompressing."""
+        data = gzip.compress(b"test content")
+        path = "bucket/test/file.txt.gz"
+        file_path = temp_local_path / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(data)
+
+        with storage.open_stream(path) as stream:
+            assert stream.read() == data
+
+    def test_open_stream_file_not_found(self, mock_env_local):
+        """Test open_stream raises FileNotFoundError when file doesn't exist."""
+        with pytest.raises(FileNotFoundError, match="Local file not found"):
+            storage.open_stream("bucket/nonexistent/file.txt")
+
+
+@pytest.mark.unit
+@pytest.mark.local
+class TestListPrefix:
+    """Tests for list_prefix() function in local mode."""
+
+    def test_list_prefix_matches_sibling_files(self, mock_env_local, temp_local_path):
+        """Test list_prefix returns storage paths of files matching the name prefix."""
+        test_dir = temp_local_path / "bucket" / "artifacts"
+        test_dir.mkdir(parents=True)
+        (test_dir / "result_00000.pkl.gz").write_bytes(b"a")
+        (test_dir / "result_00002.pkl.gz").write_bytes(b"b")
+        (test_dir / "other.txt").write_bytes(b"c")
+        (test_dir / "result_dir").mkdir()
+
+        paths = storage.list_prefix("bucket/artifacts/result_")
+
+        assert paths == {
+            "bucket/artifacts/result_00000.pkl.gz",
+            "bucket/artifacts/result_00002.pkl.gz",
+        }
+
+    def test_list_prefix_nonexistent_directory(self, mock_env_local, temp_local_path):
+        """Test list_prefix returns an empty set when the directory doesn't exist."""
+        assert storage.list_prefix("bucket/nonexistent/result_") == set()
+
 
 @pytest.mark.unit
 class TestSaveLoadJson:
@@ -162,6 +277,17 @@ class TestSaveLoadJson:
 
         assert loaded_data == test_data
 
+    def test_json_roundtrips_non_finite_floats(self, mock_env_local, temp_local_path):
+        """Test NaN/Infinity are written as JSON tokens and parsed back."""
+        path = "bucket/test/data.json"
+
+        storage.save_json(path, {"nan": float("nan"), "inf": float("inf")})
+        loaded = storage.load_json(path)
+
+        assert "NaN" in (temp_local_path / path).read_text()
+        assert math.isnan(loaded["nan"])
+        assert loaded["inf"] == float("inf")
+
     def test_save_json_pretty_formatted(self, mock_env_local, temp_local_path):
         """Test save_json uses pretty formatting (indent=2)."""
         test_data = {"key": "value"}
@@ -260,6 +386,18 @@ class TestListBlobs:
 
         assert files == []
 
+    @pytest.mark.parametrize("local_data_path", [".", "./", "bucket/.."])
+    def test_list_blobs_local_relative_base_path(
+        self, mock_env_local, temp_local_path, monkeypatch, local_data_path
+    ):
+        """Test paths are relative to a relative or non-normalized LOCAL_DATA_PATH."""
+        monkeypatch.chdir(temp_local_path)
+        monkeypatch.setenv("LOCAL_DATA_PATH", local_data_path)
+        (temp_local_path / "bucket" / "a").mkdir(parents=True)
+        (temp_local_path / "bucket" / "a" / "f.txt").write_text("content")
+
+        assert storage.list_blobs(None, "bucket") == ["bucket/a/f.txt"]
+
 
 @pytest.mark.unit
 class TestGetModeInfo:
@@ -280,6 +418,200 @@ class TestGetModeInfo:
         assert "base_path" not in info
 
 
+@pytest.mark.unit
+class TestGetGcsBucket:
+    """Tests for _get_gcs_bucket() helper."""
+
+    def test_bucket_handle_cached_per_name(self, monkeypatch):
+        """Test bucket handles are created once per bucket name."""
+        mock_client = MagicMock()
+        monkeypatch.setattr(storage, "_get_gcs_client", lambda: mock_client)
+        monkeypatch.setattr(storage, "_gcs_buckets", {})
+
+        first = storage._get_gcs_bucket("bucket-a")
+        assert storage._get_gcs_bucket("bucket-a") is first
+        storage._get_gcs_bucket("bucket-b")
+
+        assert mock_client.bucket.call_count == 2
+
+
+def _make_download_bucket(content: bytes):
+    """Build a mock bucket whose blobs serve content.
+
+    Every blob created through bucket.blob() is recorded on bucket.created.
+    """
+    bucket = MagicMock()
+    bucket.created = []
+
+    def make_blob(name):
+        blob = MagicMock()
+        blob.download_as_bytes.return_value = content
+        bucket.created.append(blob)
+        return blob
+
+    bucket.blob.side_effect = make_blob
+    return bucket
+
+
+@pytest.mark.unit
+class TestLoadBytesCloud:
+    """Tests for load_bytes() in cloud mode with a mocked bucket."""
+
+    @pytest.fixture
+    def bucket(self, mock_env_cloud, monkeypatch):
+        """Serve 1 KiB blobs from a mocked GCS bucket."""
+        pytest.importorskip("google.api_core.exceptions")
+        bucket = _make_download_bucket(bytes(range(256)) * 4)
+        monkeypatch.setattr(storage, "_get_gcs_bucket", lambda name: bucket)
+        return bucket
+
+    def test_load_makes_no_metadata_request(self, bucket):
+        """Test a read is a single download, with no get_blob."""
+        data = storage.load_bytes("runner-artifacts/input_00000.pkl", decompress=False)
+
+        assert len(data) == 1024
+        bucket.get_blob.assert_not_called()
+        assert len(bucket.created) == 1
+
+    def test_load_missing_blob_raises_file_not_found(self, bucket):
+        """Test GCS NotFound is mapped to FileNotFoundError."""
+        from google.api_core.exceptions import NotFound
+
+        bucket.blob.side_effect = None
+        bucket.blob.return_value.download_as_bytes.side_effect = NotFound("missing")
+
+        with pytest.raises(FileNotFoundError, match="gs://test-bucket/"):
+            storage.load_bytes("runner-artifacts/input_00000.pkl")
+
+
+@pytest.mark.unit
+class TestOpenStreamCloud:
+    """Tests for open_stream() in cloud mode over a real blob reader."""
+
+    def test_open_stream_reads_in_bounded_ranges(self, mock_env_cloud, monkeypatch):
+        """Test the first read fetches one small range instead of the whole blob."""
+        gcs = pytest.importorskip("google.cloud.storage")
+        content = bytes(range(256)) * (40 * 1024)  # 10 MiB
+        ranges = []
+
+        class RangeBlob(gcs.Blob):
+            def download_as_bytes(self, start=None, end=None, **kwargs):
+                ranges.append((start, end))
+                return content[start : None if end is None else end + 1]
+
+        bucket = MagicMock()
+        bucket.blob.side_effect = lambda name: RangeBlob(name, gcs.Bucket(MagicMock(), "b"))
+        monkeypatch.setattr(storage, "_get_gcs_bucket", lambda name: bucket)
+
+        with storage.open_stream("runner-artifacts/result_00000.pkl.gz") as stream:
+            assert stream.read(10) == content[:10]
+            assert ranges == [(0, storage._STREAM_CHUNK_SIZE)]
+            assert stream.read() == content[10:]
+
+
+@pytest.mark.unit
+class TestUploadChunksConcurrently:
+    """Tests for _upload_chunks_concurrently() helper."""
+
+    @pytest.fixture
+    def transfer_manager(self):
+        """Provide the google.cloud.storage transfer manager module."""
+        return pytest.importorskip("google.cloud.storage.transfer_manager")
+
+    def test_upload_stages_data_for_multipart_upload(self, transfer_manager, monkeypatch):
+        """Test data is staged to a file and uploaded in parts with thread workers."""
+        monkeypatch.setenv("GCS_MAX_CONCURRENCY", "4")
+        content = bytes(range(256)) * (96 * 1024)  # 24 MiB
+        staged = {}
+
+        def upload(filename, blob, **kwargs):
+            with open(filename, "rb") as f:
+                staged["data"] = f.read()
+            staged["filename"] = filename
+            staged.update(kwargs)
+
+        monkeypatch.setattr(transfer_manager, "upload_chunks_concurrently", upload)
+        bucket = MagicMock()
+
+        storage._upload_chunks_concurrently(bucket, "outputs/big.csv.gz", content, "text/csv")
+
+        bucket.blob.assert_called_once_with("outputs/big.csv.gz")
+        assert staged["data"] == content
+        assert staged["content_type"] == "text/csv"
+        assert staged["chunk_size"] == 6 * 1024 * 1024
+        assert staged["max_workers"] == 4
+        assert staged["worker_type"] == transfer_manager.THREAD
+
+    def test_upload_parts_respect_minimum_size(self, transfer_manager, monkeypatch):
+        """Test parts are never smaller than the multipart upload minimum."""
+        monkeypatch.setenv("GCS_MAX_CONCURRENCY", "16")
+        calls = []
+        monkeypatch.setattr(
+            transfer_manager,
+            "upload_chunks_concurrently",
+            lambda filename, blob, **kwargs: calls.append(kwargs),
+        )
+
+        storage._upload_chunks_concurrently(MagicMock(), "a.bin", b"x" * 1024, "text/plain")
+
+        assert calls[0]["chunk_size"] == storage._MIN_UPLOAD_PART_SIZE
+
+    def test_upload_failure_removes_staged_file(self, transfer_manager, monkeypatch):
+        """Test the upload error propagates and the staged file is cleaned up."""
+        staged = []
+
+        def upload(filename, blob, **kwargs):
+            staged.append(filename)
+            raise RuntimeError("upload failed")
+
+        monkeypatch.setattr(transfer_manager, "upload_chunks_concurrently", upload)
+
+        with pytest.raises(RuntimeError, match="upload failed"):
+            storage._upload_chunks_concurrently(MagicMock(), "a.bin", b"data", "text/plain")
+
+        assert not os.path.exists(staged[0])
+
+    def test_save_bytes_uses_chunked_upload_above_threshold(
+        self, transfer_manager, mock_env_cloud, monkeypatch
+    ):
+        """Test save_bytes only takes the chunked path above GCS_PARALLEL_THRESHOLD."""
+        monkeypatch.setenv("GCS_PARALLEL_THRESHOLD", "10")
+        bucket = MagicMock()
+        monkeypatch.setattr(storage, "_get_gcs_bucket", lambda name: bucket)
+        chunked = []
+        monkeypatch.setattr(
+            storage, "_upload_chunks_concurrently", lambda *args: chunked.append(args[1])
+        )
+
+        storage.save_bytes("outputs/small.txt", b"tiny")
+        storage.save_bytes("outputs/large.txt", b"x" * 100)
+
+        assert chunked == ["outputs/large.txt"]
+        bucket.blob.return_value.upload_from_string.assert_called_once_with(
+            b"tiny", content_type="text/plain"
+        )
+
+
+@pytest.mark.unit
+class TestGCSClientPool:
+    """Tests for the shared GCS client's connection pool."""
+
+    def test_gcs_client_connection_pool_enlarged(self, mock_env_cloud, monkeypatch):
+        """Test that the shared client's HTTPS connection pool is resized."""
+        pytest.importorskip("google.cloud.storage")
+        monkeypatch.setattr(storage, "_gcs_client", None)
+
+        with patch("google.cloud.storage.Client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+
+            assert storage._get_gcs_client() is mock_client
+
+        prefix, adapter = mock_client._http.mount.call_args.args
+        assert prefix == "https://"
+        assert adapter._pool_maxsize == storage._GCS_POOL_SIZE
+
+
 @pytest.mark.unit
 @pytest.mark.cloud
 @pytest.mark.skip(reason="Requires google-cloud-storage package (cloud-only dependency)")